@@ -4,6 +4,7 @@ Federation configuration API routes.
 Provides endpoints to manage federation configurations.
 """
 
+import asyncio
 import logging
 from datetime import UTC
 from typing import Annotated, Any
@@ -368,8 +369,11 @@ async def add_anthropic_server(
                 detail=f"Server '{server_name}' already exists in configuration",
             )
 
-    # Add new server
-    config.anthropic.servers.append(AnthropicServerConfig(name=server_name))
+    # Add new server (configs are frozen, so build an updated copy)
+    anthropic = config.anthropic.model_copy(
+        update={"servers": (*config.anthropic.servers, AnthropicServerConfig(name=server_name))}
+    )
+    config = config.model_copy(update={"anthropic": anthropic})
 
     # Save updated config
     saved_config = await repo.save_config(config, config_id)
@@ -416,15 +420,17 @@ async def remove_anthropic_server(
         )
 
     # Find and remove server from config
-    original_count = len(config.anthropic.servers)
-    config.anthropic.servers = [s for s in config.anthropic.servers if s.name != server_name]
+    remaining_servers = tuple(s for s in config.anthropic.servers if s.name != server_name)
 
-    if len(config.anthropic.servers) == original_count:
+    if len(remaining_servers) == len(config.anthropic.servers):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Server '{server_name}' not found in configuration",
         )
 
+    anthropic = config.anthropic.model_copy(update={"servers": remaining_servers})
+    config = config.model_copy(update={"anthropic": anthropic})
+
     # Save updated config
     saved_config = await repo.save_config(config, config_id)
 
@@ -504,8 +510,11 @@ async def add_asor_agent(
                 detail=f"Agent '{agent_id}' already exists in configuration",
             )
 
-    # Add new agent
-    config.asor.agents.append(AsorAgentConfig(id=agent_id))
+    # Add new agent (configs are frozen, so build an updated copy)
+    asor = config.asor.model_copy(
+        update={"agents": (*config.asor.agents, AsorAgentConfig(id=agent_id))}
+    )
+    config = config.model_copy(update={"asor": asor})
 
     # Save updated config
     saved_config = await repo.save_config(config, config_id)
@@ -549,15 +558,17 @@ async def remove_asor_agent(
         )
 
     # Find and remove agent
-    original_count = len(config.asor.agents)
-    config.asor.agents = [a for a in config.asor.agents if a.id != agent_id]
+    remaining_agents = tuple(a for a in config.asor.agents if a.id != agent_id)
 
-    if len(config.asor.agents) == original_count:
+    if len(remaining_agents) == len(config.asor.agents):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Agent '{agent_id}' not found in configuration",
         )
 
+    asor = config.asor.model_copy(update={"agents": remaining_agents})
+    config = config.model_copy(update={"asor": asor})
+
     # Save updated config
     saved_config = await repo.save_config(config, config_id)
 
@@ -624,13 +635,55 @@ async def sync_federation(
 
         results = {"anthropic": {"servers": [], "count": 0}, "asor": {"agents": [], "count": 0}}
 
-        # Sync Anthropic servers if enabled and requested
-        if (source is None or source == "anthropic") and config.anthropic.enabled:
+        sync_anthropic = (source is None or source == "anthropic") and config.anthropic.enabled
+        sync_asor = (source is None or source == "asor") and config.asor.enabled
+
+        # The clients make blocking HTTP calls; fetching both sources in worker threads
+        # keeps the event loop free and makes the sync wait for the slower source only
+        fetches = {}
+        if sync_anthropic:
             logger.info("Syncing servers from Anthropic MCP Registry...")
 
             anthropic_client = AnthropicFederationClient(endpoint=config.anthropic.endpoint)
+            fetches["anthropic"] = asyncio.to_thread(
+                anthropic_client.fetch_all_servers, config.anthropic.servers
+            )
+
+        if sync_asor:
+            logger.info("Syncing agents from ASOR...")
+
+            tenant_url = (
+                config.asor.endpoint.split("/api")[0]
+                if "/api" in config.asor.endpoint
+                else config.asor.endpoint
+            )
+
+            asor_client = AsorFederationClient(
+                endpoint=config.asor.endpoint,
+                auth_env_var=config.asor.auth_env_var,
+                tenant_url=tenant_url,
+            )
+            fetches["asor"] = asyncio.to_thread(asor_client.fetch_all_agents, config.asor.agents)
+
+        # A failing source is logged and skipped so the other source still registers
+        outcomes = await asyncio.gather(*fetches.values(), return_exceptions=True)
+        fetched = {}
+        for fetch_source, outcome in zip(fetches, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to fetch from {fetch_source}: {outcome}", exc_info=outcome)
+                results[fetch_source]["error"] = str(outcome)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                fetched[fetch_source] = outcome
+
+        if fetches and not fetched:
+            # Nothing to register; report the failure as before
+            raise outcomes[0]
 
-            servers = anthropic_client.fetch_all_servers(config.anthropic.servers)
+        # Sync Anthropic servers if enabled and requested
+        if "anthropic" in fetched:
+            servers = fetched["anthropic"]
 
             # Register servers via server service
             from ..services.server_service import server_service
@@ -682,22 +735,8 @@ async def sync_federation(
             logger.info(f"Synced {results['anthropic']['count']} servers from Anthropic")
 
         # Sync ASOR agents if enabled and requested
-        if (source is None or source == "asor") and config.asor.enabled:
-            logger.info("Syncing agents from ASOR...")
-
-            tenant_url = (
-                config.asor.endpoint.split("/api")[0]
-                if "/api" in config.asor.endpoint
-                else config.asor.endpoint
-            )
-
-            asor_client = AsorFederationClient(
-                endpoint=config.asor.endpoint,
-                auth_env_var=config.asor.auth_env_var,
-                tenant_url=tenant_url,
-            )
-
-            agents = asor_client.fetch_all_agents(config.asor.agents)
+        if "asor" in fetched:
+            agents = fetched["asor"]
 
             # Register agents
             from datetime import datetime
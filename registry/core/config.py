@@ -51,6 +51,14 @@ class Settings(BaseSettings):
     embeddings_provider: str = "sentence-transformers"  # 'sentence-transformers' or 'litellm'
     embeddings_model_name: str = "all-MiniLM-L6-v2"
     embeddings_model_dimensions: int = 384  # 384 for default and 1024 for bedrock titan v2
+    embeddings_batch_max_size: int = 64  # Max texts coalesced into one encode call
+    embeddings_cache_size: int = 1024  # Entity embeddings memoized by text hash; 0 disables
+
+    # FAISS index settings (file storage backend only)
+    faiss_save_debounce_seconds: float = 0.5  # Coalesce bursts of index updates into one save
+    # Vector storage for newly created indexes: "none" (float32) or "fp16" (half the memory)
+    faiss_index_quantization: str = "none"
+    faiss_num_threads: int = 0  # OpenMP threads for FAISS search; 0 keeps the FAISS default
 
     # HNSW vector search tuning (only used with DocumentDB backend)
     # Higher efSearch improves recall at the cost of query latency.
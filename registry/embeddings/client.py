@@ -5,6 +5,7 @@ This module provides a unified interface for generating embeddings from multiple
 providers including local sentence-transformers models and cloud-based APIs via LiteLLM.
 """
 
+import asyncio
 import logging
 import os
 from abc import (
@@ -12,6 +13,7 @@ from abc import (
     abstractmethod,
 )
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 
@@ -40,6 +42,27 @@ class EmbeddingsClient(ABC):
         """
         pass
 
+    async def encode_async(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+        """
+        Generate embeddings without blocking the event loop.
+
+        The default runs encode() in a worker thread. Clients backed by a
+        remote embeddings service override this with a native async call.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            NumPy array of embeddings with shape (len(texts), embedding_dimension)
+
+        Raises:
+            RuntimeError: If encoding fails
+        """
+        return await asyncio.to_thread(self.encode, texts)
+
     @abstractmethod
     def get_embedding_dimension(self) -> int:
         """
@@ -232,6 +255,42 @@ class LiteLLMClient(EmbeddingsClient):
             os.environ[env_var] = self.api_key
             logger.debug(f"Set {env_var} environment variable for {provider}")
 
+    def _embedding_kwargs(
+        self,
+        texts: list[str],
+    ) -> dict[str, Any]:
+        """Build the keyword arguments for a LiteLLM embedding request."""
+        # LiteLLM expects 'input' parameter
+        kwargs: dict[str, Any] = {"model": self.model_name, "input": texts}
+
+        if self.api_base:
+            kwargs["api_base"] = self.api_base
+
+        return kwargs
+
+    def _response_to_array(
+        self,
+        response: Any,
+    ) -> np.ndarray:
+        """Extract embeddings from a LiteLLM response and validate their dimension."""
+        embeddings_list = [item["embedding"] for item in response["data"]]
+        embeddings_array = np.array(embeddings_list, dtype=np.float32)
+
+        # Validate dimension on first call
+        if self._validated_dimension is None:
+            self._validated_dimension = embeddings_array.shape[1]
+            if self._embedding_dimension and self._validated_dimension != self._embedding_dimension:
+                logger.warning(
+                    f"Embedding dimension mismatch: expected {self._embedding_dimension}, "
+                    f"got {self._validated_dimension}"
+                )
+
+        logger.debug(
+            f"Generated {len(embeddings_list)} embeddings "
+            f"with dimension {self._validated_dimension}"
+        )
+        return embeddings_array
+
     def encode(
         self,
         texts: list[str],
@@ -255,35 +314,43 @@ class LiteLLMClient(EmbeddingsClient):
             raise RuntimeError("LiteLLM is not installed. Install it with: uv add litellm") from e
 
         try:
-            # LiteLLM expects 'input' parameter
-            kwargs = {"model": self.model_name, "input": texts}
+            logger.debug(f"Calling LiteLLM embedding API with model: {self.model_name}")
+            response = embedding(**self._embedding_kwargs(texts))
+            return self._response_to_array(response)
 
-            if self.api_base:
-                kwargs["api_base"] = self.api_base
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings via LiteLLM: {e}", exc_info=True)
+            raise RuntimeError(f"Failed to generate embeddings via LiteLLM: {e}") from e
 
-            logger.debug(f"Calling LiteLLM embedding API with model: {self.model_name}")
-            response = embedding(**kwargs)
-
-            # Extract embeddings from response
-            embeddings_list = [item["embedding"] for item in response["data"]]
-            embeddings_array = np.array(embeddings_list, dtype=np.float32)
-
-            # Validate dimension on first call
-            if self._validated_dimension is None:
-                self._validated_dimension = embeddings_array.shape[1]
-                if (
-                    self._embedding_dimension
-                    and self._validated_dimension != self._embedding_dimension
-                ):
-                    logger.warning(
-                        f"Embedding dimension mismatch: expected {self._embedding_dimension}, "
-                        f"got {self._validated_dimension}"
-                    )
-
-            logger.debug(
-                f"Generated {len(embeddings_list)} embeddings with dimension {self._validated_dimension}"
-            )
-            return embeddings_array
+    async def encode_async(
+        self,
+        texts: list[str],
+    ) -> np.ndarray:
+        """
+        Generate embeddings using LiteLLM's async client.
+
+        The request is awaited on the event loop instead of occupying a worker
+        thread for the duration of the HTTP call.
+
+        Args:
+            texts: List of text strings to encode
+
+        Returns:
+            NumPy array of embeddings
+
+        Raises:
+            RuntimeError: If encoding fails or LiteLLM is not installed
+        """
+        try:
+            from litellm import aembedding
+        except ImportError as e:
+            logger.error("LiteLLM is not installed. Install it with: uv add litellm")
+            raise RuntimeError("LiteLLM is not installed. Install it with: uv add litellm") from e
+
+        try:
+            logger.debug(f"Calling LiteLLM async embedding API with model: {self.model_name}")
+            response = await aembedding(**self._embedding_kwargs(texts))
+            return self._response_to_array(response)
 
         except Exception as e:
             logger.error(f"Failed to generate embeddings via LiteLLM: {e}", exc_info=True)
@@ -497,6 +497,9 @@ async def lifespan(app: FastAPI):
             logger.info("📝 Closing audit logger...")
             await audit_logger.close()
 
+        # Persist search index updates still waiting on a deferred save
+        await get_search_repository().flush()
+
         # Shutdown services gracefully
         await health_service.shutdown()
         logger.info("✅ Shutdown completed successfully!")
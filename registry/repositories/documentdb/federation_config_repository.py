@@ -46,7 +46,8 @@ class DocumentDBFederationConfigRepository(FederationConfigRepositoryBase):
             config_doc.pop("created_at", None)
             config_doc.pop("updated_at", None)
 
-            config = FederationConfig(**config_doc)
+            # Stored documents are written by save_config via model_dump()
+            config = FederationConfig.from_trusted_dict(config_doc)
             logger.info(f"Retrieved federation config: {config_id}")
             return config
 
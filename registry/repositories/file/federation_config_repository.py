@@ -3,6 +3,7 @@
 import json
 import logging
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,6 +12,26 @@ from ..interfaces import FederationConfigRepositoryBase
 
 logger = logging.getLogger(__name__)
 
+CONFIG_CACHE_SIZE: int = 8
+
+
+@lru_cache(maxsize=CONFIG_CACHE_SIZE)
+def _load_config_file(
+    config_path: str,
+    mtime_ns: int,
+) -> FederationConfig:
+    """Parse a federation config file, memoized on (path, mtime).
+
+    Keying on the modification time picks up external edits to the file;
+    save_config and delete_config also clear the cache, since a write within
+    one timestamp tick of a coarse filesystem leaves the mtime unchanged.
+    Sharing the returned instance is safe because the models are frozen.
+    """
+    # Decode straight from bytes in pydantic-core; internal fields
+    # (config_id, created_at, updated_at) are ignored as extras
+    with open(config_path, "rb") as f:
+        return FederationConfig.model_validate_json(f.read())
+
 
 class FileFederationConfigRepository(FederationConfigRepositoryBase):
     """File-based implementation of federation configuration repository."""
@@ -53,15 +74,7 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
                 logger.info(f"Federation config file not found: {config_path}")
                 return None
 
-            with open(config_path) as f:
-                data = json.load(f)
-
-            # Remove internal fields before creating Pydantic model
-            data.pop("config_id", None)
-            data.pop("created_at", None)
-            data.pop("updated_at", None)
-
-            config = FederationConfig(**data)
+            config = _load_config_file(str(config_path), config_path.stat().st_mtime_ns)
             logger.info(f"Retrieved federation config from file: {config_id}")
             return config
 
@@ -108,6 +121,7 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
             # Write to file
             with open(config_path, "w") as f:
                 json.dump(doc, f, indent=2)
+            _load_config_file.cache_clear()
 
             logger.info(f"Saved federation config to file: {config_id} -> {config_path}")
             return config
@@ -134,6 +148,7 @@ class FileFederationConfigRepository(FederationConfigRepositoryBase):
                 return False
 
             config_path.unlink()
+            _load_config_file.cache_clear()
             logger.info(f"Deleted federation config file: {config_id}")
             return True
 
@@ -117,6 +117,10 @@ class FaissSearchRepository(SearchRepositoryBase):
         # Explicitly initialize the shared FAISS service used by this repository.
         await self.faiss_service.initialize()
 
+    async def flush(self) -> None:
+        """Write FAISS updates still waiting on the debounced save."""
+        await self.faiss_service.flush()
+
     async def index_server(
         self, server_path: str, server_data: dict[str, Any], is_enabled: bool
     ) -> None:
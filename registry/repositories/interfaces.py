@@ -901,6 +901,14 @@ class SearchRepositoryBase(ABC):
         """
         pass
 
+    async def flush(self) -> None:
+        """Persist any index updates that are still buffered.
+
+        Default implementation is a no-op. Override in implementations
+        that defer writes, so they are not lost on shutdown.
+        """
+        pass
+
     async def search_by_tags(
         self,
         tags: list[str],
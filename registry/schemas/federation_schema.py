@@ -1,63 +1,132 @@
 """Simplified federation configuration schemas."""
 
-from pydantic import BaseModel, Field
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 
 class AnthropicServerConfig(BaseModel):
     """Anthropic server configuration."""
 
+    __slots__ = ()
+
+    model_config = ConfigDict(frozen=True)
+
     name: str
 
 
 class AnthropicFederationConfig(BaseModel):
     """Anthropic federation configuration."""
 
+    __slots__ = ()
+
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     endpoint: str = "https://registry.modelcontextprotocol.io"
     sync_on_startup: bool = False
-    servers: list[AnthropicServerConfig] = Field(default_factory=list)
+    servers: tuple[AnthropicServerConfig, ...] = ()
 
 
 class AsorAgentConfig(BaseModel):
     """ASOR agent configuration."""
 
+    __slots__ = ()
+
+    model_config = ConfigDict(frozen=True)
+
     id: str
 
 
 class AsorFederationConfig(BaseModel):
     """ASOR federation configuration."""
 
+    __slots__ = ()
+
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = False
     endpoint: str = ""
     auth_env_var: str | None = None
     sync_on_startup: bool = False
-    agents: list[AsorAgentConfig] = Field(default_factory=list)
+    agents: tuple[AsorAgentConfig, ...] = ()
+
+
+# Shared defaults for a bare FederationConfig. The models are frozen, so one
+# instance can back every config that does not override the section.
+_DEFAULT_ANTHROPIC_CONFIG = AnthropicFederationConfig()
+_DEFAULT_ASOR_CONFIG = AsorFederationConfig()
 
 
 class FederationConfig(BaseModel):
     """Root federation configuration."""
 
-    anthropic: AnthropicFederationConfig = Field(default_factory=AnthropicFederationConfig)
-    asor: AsorFederationConfig = Field(default_factory=AsorFederationConfig)
+    __slots__ = ()
+
+    model_config = ConfigDict(frozen=True)
+
+    anthropic: AnthropicFederationConfig = _DEFAULT_ANTHROPIC_CONFIG
+    asor: AsorFederationConfig = _DEFAULT_ASOR_CONFIG
+
+    _enabled: tuple[str, ...] = PrivateAttr(default=())
+
+    def model_post_init(
+        self,
+        context: Any,
+    ) -> None:
+        """Precompute enabled federation names; runs for validated and constructed configs."""
+        self._enabled = tuple(
+            name
+            for name, source in (("anthropic", self.anthropic), ("asor", self.asor))
+            if source.enabled
+        )
+
+    def model_copy(
+        self,
+        *,
+        update: dict[str, Any] | None = None,
+        deep: bool = False,
+    ) -> "FederationConfig":
+        """Copy the config, recomputing the enabled names that model_post_init caches.
+
+        Pydantic's model_copy does not run model_post_init, so without this a copy
+        that toggles a section's enabled flag would keep the original's names.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        copied.model_post_init(None)
+        return copied
+
+    @classmethod
+    def from_trusted_dict(
+        cls,
+        data: dict[str, Any],
+    ) -> "FederationConfig":
+        """Build a config from a document the registry wrote itself, skipping validation.
+
+        Only use this for data produced by model_dump() (e.g. the stored config
+        document). Anything coming from a client or a remote registry must go
+        through normal validation.
+        """
+        anthropic_data = dict(data.get("anthropic") or {})
+        anthropic_data["servers"] = tuple(
+            AnthropicServerConfig.model_construct(**server)
+            for server in anthropic_data.get("servers") or ()
+        )
+
+        asor_data = dict(data.get("asor") or {})
+        asor_data["agents"] = tuple(
+            AsorAgentConfig.model_construct(**agent) for agent in asor_data.get("agents") or ()
+        )
+
+        return cls.model_construct(
+            anthropic=AnthropicFederationConfig.model_construct(**anthropic_data),
+            asor=AsorFederationConfig.model_construct(**asor_data),
+        )
 
     def is_any_federation_enabled(self) -> bool:
         """Check if any federation is enabled."""
-        return self.anthropic.enabled or self.asor.enabled
+        return bool(self._enabled)
 
     def get_enabled_federations(self) -> list[str]:
         """Get list of enabled federation names."""
-        enabled = []
-        if self.anthropic.enabled:
-            enabled.append("anthropic")
-        if self.asor.enabled:
-            enabled.append("asor")
-        return enabled
-
-
-# Add missing FederatedServer class for compatibility
-class FederatedServer(BaseModel):
-    """Federated server configuration."""
-
-    name: str
-    endpoint: str
-    enabled: bool = True
+        return list(self._enabled)
@@ -1,13 +1,19 @@
 import asyncio
-import json
+import hashlib
+import heapq
 import logging
+import os
 import re
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from operator import itemgetter
+from pathlib import Path
 from typing import Any
 
 import faiss
 import numpy as np
-from pydantic import HttpUrl
+from pydantic_core import from_json, to_json
 
 from ..core.config import settings
 from ..embeddings import (
@@ -18,20 +24,162 @@ from ..schemas.agent_models import AgentCard
 
 logger = logging.getLogger(__name__)
 
+# Word tokens in queries and names; findall skips the empty strings re.split yields
+_WORD_RE = re.compile(r"\w+")
+
+# Common words ignored when matching query keywords against names, tags and tools
+_QUERY_STOPWORDS: frozenset[str] = frozenset(
+    {
+        "a",
+        "an",
+        "the",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "can",
+        "to",
+        "of",
+        "in",
+        "on",
+        "at",
+        "by",
+        "for",
+        "with",
+        "about",
+        "as",
+        "into",
+        "through",
+        "from",
+        "what",
+        "when",
+        "where",
+        "who",
+        "which",
+        "how",
+        "why",
+        "get",
+        "set",
+        "put",
+    }
+)
+
+# Sort key for ranking search result dicts
+_relevance_key = itemgetter("relevance_score")
+# Sort key for (score, tool) pairs collected while matching tools
+_match_score_key = itemgetter(0)
+
+
+def _temp_path_for(
+    path: Path,
+) -> Path:
+    """Return the sibling temp path used to write a file before swapping it in."""
+    return path.with_name(f"{path.name}.tmp")
+
+
+def _content_hash(
+    payload: bytes,
+) -> str:
+    """Return a short BLAKE2b fingerprint of serialized content."""
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
-class _PydanticAwareJSONEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles Pydantic and standard types."""
 
-    def default(
+def _tokenize_query(
+    query: str,
+) -> list[str]:
+    """Split a query into lowercase keywords, dropping stopwords and short tokens."""
+    return [
+        token
+        for token in _WORD_RE.findall(query.lower())
+        if len(token) > 2 and token not in _QUERY_STOPWORDS
+    ]
+
+
+class _EncodeBatcher:
+    """Coalesce concurrent single-text encode requests into batched model calls.
+
+    An idle batcher encodes a text right away, so a lone caller never waits.
+    Texts submitted while an encode is in flight queue up and go out together
+    once it finishes (or as soon as the queue is full). Texts are sorted by
+    length within a batch so transformer models pad less, and each caller
+    receives the row for its own text.
+    """
+
+    def __init__(
         self,
-        o: Any,
+        encode: Callable[[list[str]], Awaitable[Sequence[Any]]],
+    ):
+        self._encode = encode
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def encode(
+        self,
+        text: str,
     ) -> Any:
-        """Convert non-serializable types to JSON-compatible formats."""
-        if isinstance(o, HttpUrl):
-            return str(o)
-        if isinstance(o, datetime):
-            return o.isoformat()
-        return super().default(o)
+        """Encode one text, sharing a model call with concurrent requests."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+
+        if not self._tasks or len(self._pending) >= settings.embeddings_batch_max_size:
+            self._dispatch()
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Hand the pending batch to a background encode task."""
+        batch, self._pending = self._pending, []
+        if batch:
+            # Hold a reference so the task is not garbage collected mid-flight
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._on_batch_done)
+
+    def _on_batch_done(
+        self,
+        task: asyncio.Task,
+    ) -> None:
+        """Send texts that queued up during the finished encode as the next batch."""
+        self._tasks.discard(task)
+        if self._pending:
+            self._dispatch()
+
+    async def _run(
+        self,
+        batch: list[tuple[str, asyncio.Future]],
+    ) -> None:
+        """Encode a batch and resolve each caller's future."""
+        batch.sort(key=lambda item: len(item[0]))
+        try:
+            embeddings = await self._encode([text for text, _ in batch])
+            if len(embeddings) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        if len(batch) > 1:
+            logger.debug(f"Encoded {len(batch)} texts in one batch")
+        for (_, future), embedding in zip(batch, embeddings, strict=False):
+            if not future.done():
+                future.set_result(embedding)
 
 
 class FaissService:
@@ -41,10 +189,35 @@ class FaissService:
         self.embedding_model: EmbeddingsClient | None = None
         self.faiss_index: faiss.IndexIDMap | None = None
         self.metadata_store: dict[str, dict[str, Any]] = {}
+        # Reverse of metadata_store for mapping FAISS hits back to paths
+        self._id_to_path: dict[int, str] = {}
+        # Ids of superseded or removed vectors awaiting a batched remove_ids
+        self._tombstoned_ids: set[int] = set()
+        # FAISS indexes are not safe for a search thread racing a write
+        self._index_lock = threading.Lock()
         self.next_id_counter: int = 0
+        self._encode_batcher = _EncodeBatcher(self._encode_texts)
+        # LRU of entity embeddings keyed by provider, model and text hash
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._dirty: bool = False
+        self._save_task: asyncio.Task | None = None
+        self._save_lock = asyncio.Lock()
+        # Entity-type handlers behind the generic add/remove wrappers
+        self._add_handlers: dict[str, Callable[[str, dict[str, Any], bool], Awaitable[None]]] = {
+            "a2a_agent": self._add_or_update_agent_info,
+            "mcp_server": self.add_or_update_service,
+        }
+        self._remove_handlers: dict[str, Callable[[str], Awaitable[None]]] = {
+            "a2a_agent": self.remove_agent,
+        }
 
     async def initialize(self):
         """Initialize the FAISS service - load model and index."""
+        if settings.faiss_num_threads > 0:
+            # Searches run one query at a time; capping OpenMP threads avoids oversubscription
+            faiss.omp_set_num_threads(settings.faiss_num_threads)
+            logger.info(f"FAISS OpenMP threads set to {settings.faiss_num_threads}")
+
         await self._load_embedding_model()
         await self._load_faiss_data()
 
@@ -101,6 +274,38 @@ class FaissService:
             logger.error(f"Failed to load embedding model: {e}", exc_info=True)
             self.embedding_model = None
 
+    async def _encode_texts(
+        self,
+        texts: list[str],
+    ) -> Sequence[Any]:
+        """Encode a batch of texts with the current embeddings model."""
+        return await self.embedding_model.encode_async(texts)
+
+    async def _embed_text(
+        self,
+        text: str,
+    ) -> np.ndarray:
+        """Embed an entity text, reusing the vector when the same text was seen before."""
+        cache_size = settings.embeddings_cache_size
+        if cache_size <= 0:
+            return await self._encode_batcher.encode(text)
+
+        # The provider and model are part of the key so a model switch never reuses vectors
+        key = _content_hash(
+            f"{settings.embeddings_provider}:{settings.embeddings_model_name}:{text}".encode()
+        )
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+
+        # Copy the row so the cache does not pin the whole batch array
+        embedding = np.array(await self._encode_batcher.encode(text), dtype=np.float32)
+        self._embedding_cache[key] = embedding
+        if len(self._embedding_cache) > cache_size:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+
     async def _load_faiss_data(self):
         """Load existing FAISS index and metadata or create new ones."""
         if settings.faiss_index_path.exists() and settings.faiss_metadata_path.exists():
@@ -109,10 +314,13 @@ class FaissService:
                 self.faiss_index = faiss.read_index(str(settings.faiss_index_path))
 
                 logger.info(f"Loading FAISS metadata from {settings.faiss_metadata_path}")
-                with open(settings.faiss_metadata_path) as f:
-                    loaded_metadata = json.load(f)
+                with open(settings.faiss_metadata_path, "rb") as f:
+                    loaded_metadata = from_json(f.read())
                     self.metadata_store = loaded_metadata.get("metadata", {})
                     self.next_id_counter = loaded_metadata.get("next_id", 0)
+                self._id_to_path = {
+                    entry.get("id"): path for path, entry in self.metadata_store.items()
+                }
 
                 logger.info(
                     f"FAISS data loaded. Index size: {self.faiss_index.ntotal if self.faiss_index else 0}. Next ID: {self.next_id_counter}"
@@ -124,6 +332,15 @@ class FaissService:
                         f"Loaded FAISS index dimension ({self.faiss_index.d}) differs from expected ({settings.embeddings_model_dimensions}). Re-initializing."
                     )
                     self._initialize_new_index()
+                else:
+                    # Vectors whose id no metadata entry owns (e.g. superseded before a
+                    # crash) are tombstoned so the next save purges them.
+                    stored_ids = faiss.vector_to_array(self.faiss_index.id_map).tolist()
+                    self._tombstoned_ids = set(stored_ids) - self._id_to_path.keys()
+                    if self._tombstoned_ids:
+                        logger.info(
+                            f"Tombstoned {len(self._tombstoned_ids)} orphaned vectors in loaded index"
+                        )
 
             except Exception as e:
                 logger.error(f"Error loading FAISS data: {e}. Re-initializing.", exc_info=True)
@@ -137,124 +354,227 @@ class FaissService:
 
         Uses IndexFlatIP instead of IndexFlatL2 to enable cosine similarity search.
         When embeddings are normalized to unit length, inner product equals cosine similarity.
+        With faiss_index_quantization="fp16" vectors are stored as half-precision
+        scalar-quantized codes, which halves memory and needs no training step.
         """
-        self.faiss_index = faiss.IndexIDMap(faiss.IndexFlatIP(settings.embeddings_model_dimensions))
+        dimension = settings.embeddings_model_dimensions
+        quantization = settings.faiss_index_quantization
+
+        if quantization == "fp16":
+            base_index = faiss.IndexScalarQuantizer(
+                dimension,
+                faiss.ScalarQuantizer.QT_fp16,
+                faiss.METRIC_INNER_PRODUCT,
+            )
+        else:
+            if quantization != "none":
+                logger.warning(
+                    f"Unknown faiss_index_quantization '{quantization}', using full precision"
+                )
+                quantization = "none"
+            base_index = faiss.IndexFlatIP(dimension)
+
+        self.faiss_index = faiss.IndexIDMap(base_index)
         self.metadata_store = {}
+        self._id_to_path = {}
+        self._tombstoned_ids = set()
         self.next_id_counter = 0
         logger.info(
-            f"Initialized FAISS IndexFlatIP with {settings.embeddings_model_dimensions} dimensions for cosine similarity"
+            f"Initialized FAISS inner product index with {dimension} dimensions "
+            f"for cosine similarity (quantization: {quantization})"
         )
 
     async def save_data(self):
         """Save FAISS index and metadata to disk."""
+        async with self._save_lock:
+            await self._write_data()
+
+    async def _write_data(self) -> None:
+        """Write index and metadata atomically; callers must hold _save_lock."""
         if self.faiss_index is None:
             logger.error("FAISS index is not initialized. Cannot save.")
             return
 
         try:
+            self._purge_tombstoned_ids()
+
             # Ensure directory exists
             settings.servers_dir.mkdir(parents=True, exist_ok=True)
 
+            # Snapshot metadata before the index so a concurrent upsert can only leave an
+            # unreferenced vector on disk, never metadata pointing at a missing vector.
+            # pydantic-core serializes HttpUrl and datetime values natively
+            payload = to_json({"metadata": self.metadata_store, "next_id": self.next_id_counter})
+
             logger.info(
                 f"Saving FAISS index to {settings.faiss_index_path} (Size: {self.faiss_index.ntotal})"
             )
-            faiss.write_index(self.faiss_index, str(settings.faiss_index_path))
+            await asyncio.to_thread(self._write_index_file, settings.faiss_index_path)
 
             logger.info(f"Saving FAISS metadata to {settings.faiss_metadata_path}")
-            with open(settings.faiss_metadata_path, "w") as f:
-                json.dump(
-                    {"metadata": self.metadata_store, "next_id": self.next_id_counter},
-                    f,
-                    indent=2,
-                    cls=_PydanticAwareJSONEncoder,
-                )
+            # Write to a temp file and swap it in so a crash never leaves truncated JSON
+            tmp_path = _temp_path_for(settings.faiss_metadata_path)
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, settings.faiss_metadata_path)
 
             logger.info("FAISS data saved successfully.")
         except Exception as e:
             logger.error(f"Error saving FAISS data: {e}", exc_info=True)
 
+    def _write_index_file(
+        self,
+        index_path: Path,
+    ) -> None:
+        """Write the FAISS index to a temp file and atomically move it into place.
+
+        Only the in-memory serialization holds _index_lock; upserts take the same
+        lock on the event loop, so the slower file write happens outside it.
+        """
+        with self._index_lock:
+            index_bytes = faiss.serialize_index(self.faiss_index)
+
+        tmp_path = _temp_path_for(index_path)
+        with open(tmp_path, "wb") as f:
+            f.write(index_bytes)
+        os.replace(tmp_path, index_path)
+
+    def _tombstone_faiss_id(
+        self,
+        faiss_id: int,
+    ) -> None:
+        """Hide a vector from search now and remove it from the index on the next save.
+
+        remove_ids on a flat index compacts the whole vector array, so stale
+        vectors are collected and removed in a single batch instead.
+        """
+        self._id_to_path.pop(faiss_id, None)
+        self._tombstoned_ids.add(faiss_id)
+
+    def _claim_faiss_id(
+        self,
+        entity_path: str,
+        faiss_id: int,
+    ) -> None:
+        """Map faiss_id to entity_path, tombstoning the vector the path held before.
+
+        The metadata entry is re-read here rather than captured before the awaited
+        encode, so concurrent upserts of one path never leave an orphan vector.
+        """
+        current_entry = self.metadata_store.get(entity_path)
+        if current_entry is not None and current_entry.get("id") != faiss_id:
+            self._tombstone_faiss_id(current_entry["id"])
+        self._id_to_path[faiss_id] = entity_path
+
+    def _purge_tombstoned_ids(self) -> None:
+        """Remove all tombstoned vectors from the FAISS index in one call."""
+        if not self._tombstoned_ids:
+            return
+
+        ids = np.fromiter(self._tombstoned_ids, dtype=np.int64, count=len(self._tombstoned_ids))
+        try:
+            with self._index_lock:
+                num_removed = self.faiss_index.remove_ids(ids)
+        except Exception as e:
+            logger.warning(f"Could not remove {len(ids)} stale FAISS vector(s): {e}")
+            return
+
+        self._tombstoned_ids.clear()
+        logger.info(f"Removed {num_removed} stale vector(s) from FAISS index")
+
+    def _schedule_save(self) -> None:
+        """Mark the index dirty and arrange a single debounced save.
+
+        Updates arriving within the debounce window share one save_data call
+        instead of each rewriting the full index and metadata files.
+        """
+        self._dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._save_after_debounce())
+
+    async def _save_after_debounce(self) -> None:
+        """Wait out the debounce window, then flush pending changes."""
+        await asyncio.sleep(settings.faiss_save_debounce_seconds)
+        # Let updates made during the save schedule a follow-up save
+        self._save_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Persist pending index and metadata changes immediately.
+
+        Called by the debounced save and at shutdown so no update is lost.
+        """
+        async with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            await self._write_data()
+
     def _get_text_for_embedding(self, server_info: dict[str, Any]) -> str:
-        """Prepare text string from server info (including tools and metadata) for embedding."""
-        name = server_info.get("server_name", "")
-        description = server_info.get("description", "")
-        tags = server_info.get("tags", [])
-        tag_string = ", ".join(tags)
-        tool_list = server_info.get("tool_list") or []
+        """Prepare text string from server info (including tools and metadata) for embedding.
+
+        The output is compared with the stored text to decide whether to re-embed,
+        so its format must stay stable.
+        """
         tool_snippets = []
-        for tool in tool_list:
-            tool_name = tool.get("name", "")
-            parsed_description = tool.get("parsed_description", {}) or {}
+        for tool in server_info.get("tool_list") or []:
+            parsed_description = tool.get("parsed_description") or {}
             tool_desc = parsed_description.get("main") or tool.get("description", "")
             tool_args = parsed_description.get("args", "")
-            snippet = f"Tool: {tool_name}. Description: {tool_desc}. Args: {tool_args}"
-            tool_snippets.append(snippet.strip())
-
-        tools_section = "\n".join(tool_snippets)
-
-        metadata = server_info.get("metadata", {})
-        metadata_snippets = []
-        if metadata:
-            for key, value in metadata.items():
-                if isinstance(value, (dict, list)):
-                    value_str = str(value)
-                else:
-                    value_str = str(value)
-                metadata_snippets.append(f"{key}: {value_str}")
-
-        metadata_section = "\n".join(metadata_snippets) if metadata_snippets else ""
+            tool_snippets.append(
+                f"Tool: {tool.get('name', '')}. Description: {tool_desc}. Args: {tool_args}".strip()
+            )
 
         text_parts = [
-            f"Name: {name}",
-            f"Description: {description}",
-            f"Tags: {tag_string}",
-            f"Tools:\n{tools_section}",
+            f"Name: {server_info.get('server_name', '')}",
+            f"Description: {server_info.get('description', '')}",
+            f"Tags: {', '.join(server_info.get('tags', []))}",
+            "Tools:\n" + "\n".join(tool_snippets),
         ]
 
-        if metadata_section:
-            text_parts.append(f"Metadata:\n{metadata_section}")
+        metadata = server_info.get("metadata")
+        if metadata:
+            text_parts.append(
+                "Metadata:\n" + "\n".join(f"{key}: {value!s}" for key, value in metadata.items())
+            )
 
         return "\n".join(text_parts).strip()
 
     def _get_text_for_agent(self, agent_card: AgentCard) -> str:
-        """Prepare text string from agent card (including metadata) for embedding."""
-        name = agent_card.name
-        description = agent_card.description
-
-        skills_text = ""
-        if agent_card.skills:
-            skill_names = [skill.name for skill in agent_card.skills]
-            skill_descriptions = [
-                f"{skill.name}: {skill.description}" for skill in agent_card.skills
-            ]
-            skills_text = "Skills: " + ", ".join(skill_names)
-            skills_text += "\nSkill Details: " + " | ".join(skill_descriptions)
-
-        tags = agent_card.tags
-        tag_string = ", ".join(tags) if tags else ""
+        """Prepare text string from agent card (including metadata) for embedding.
 
+        Like the server text, the output decides whether to re-embed, so its
+        format must stay stable.
+        """
         text_parts = [
-            f"Name: {name}",
-            f"Description: {description}",
+            f"Name: {agent_card.name}",
+            f"Description: {agent_card.description}",
         ]
 
-        if skills_text:
-            text_parts.append(skills_text)
+        if agent_card.skills:
+            # Collect names and details in a single pass over the skills
+            skill_names = []
+            skill_details = []
+            for skill in agent_card.skills:
+                skill_name = skill.name
+                skill_names.append(skill_name)
+                skill_details.append(f"{skill_name}: {skill.description}")
+            text_parts.append(
+                "Skills: "
+                + ", ".join(skill_names)
+                + "\nSkill Details: "
+                + " | ".join(skill_details)
+            )
 
+        tag_string = ", ".join(agent_card.tags) if agent_card.tags else ""
         if tag_string:
             text_parts.append(f"Tags: {tag_string}")
 
         if agent_card.metadata:
-            metadata_snippets = []
-            for key, value in agent_card.metadata.items():
-                if isinstance(value, (dict, list)):
-                    value_str = str(value)
-                else:
-                    value_str = str(value)
-                metadata_snippets.append(f"{key}: {value_str}")
-
-            if metadata_snippets:
-                metadata_section = "\n".join(metadata_snippets)
-                text_parts.append(f"Metadata:\n{metadata_section}")
+            text_parts.append(
+                "Metadata:\n"
+                + "\n".join(f"{key}: {value!s}" for key, value in agent_card.metadata.items())
+            )
 
         return "\n".join(text_parts)
 
@@ -298,35 +618,21 @@ class FaissService:
 
         if needs_new_embedding:
             try:
-                # Run model encoding in a separate thread
-                embedding = await asyncio.to_thread(self.embedding_model.encode, [text_to_embed])
-                embedding_np = np.array([embedding[0]], dtype=np.float32)
+                # Reuse a cached vector or encode batched with any concurrent requests
+                embedding = await self._embed_text(text_to_embed)
 
                 # Normalize embedding for cosine similarity (IndexFlatIP)
-                normalized_embedding = self._normalize_embedding(embedding_np[0])
-                embedding_np = np.array([normalized_embedding], dtype=np.float32)
-                logger.debug(
-                    f"Normalized embedding for '{service_path}' (norm check: {np.linalg.norm(normalized_embedding):.4f})"
-                )
+                embedding_np = self._normalize_embedding(np.asarray(embedding).reshape(1, -1))
 
-                ids_to_remove = np.array([current_faiss_id])
                 if existing_entry:
-                    try:
-                        num_removed = self.faiss_index.remove_ids(ids_to_remove)
-                        if num_removed > 0:
-                            logger.info(
-                                f"Removed {num_removed} old vector(s) for FAISS ID {current_faiss_id} ({service_path})."
-                            )
-                        else:
-                            logger.info(
-                                f"No old vector found for FAISS ID {current_faiss_id} ({service_path}) during update, or ID not in index."
-                            )
-                    except Exception as e_remove:
-                        logger.warning(
-                            f"Issue removing FAISS ID {current_faiss_id} for {service_path}: {e_remove}. Proceeding to add."
-                        )
+                    # Re-embed under a fresh id; the old vector is removed in bulk on save
+                    current_faiss_id = self.next_id_counter
+                    self.next_id_counter += 1
 
-                self.faiss_index.add_with_ids(embedding_np, np.array([current_faiss_id]))
+                with self._index_lock:
+                    self.faiss_index.add_with_ids(
+                        embedding_np, np.array([current_faiss_id], dtype=np.int64)
+                    )
                 logger.info(
                     f"Added/Updated vector for '{service_path}' with FAISS ID {current_faiss_id}."
                 )
@@ -345,6 +651,7 @@ class FaissService:
             or needs_new_embedding
             or existing_entry.get("full_server_info") != enriched_server_info
         ):
+            self._claim_faiss_id(service_path, current_faiss_id)
             self.metadata_store[service_path] = {
                 "id": current_faiss_id,
                 "text_for_embedding": text_to_embed,
@@ -352,7 +659,7 @@ class FaissService:
                 "entity_type": server_info.get("entity_type", "mcp_server"),
             }
             logger.debug(f"Updated faiss_metadata_store for '{service_path}'.")
-            await self.save_data()
+            self._schedule_save()
         else:
             logger.debug(
                 f"No changes to FAISS vector or enriched full_server_info for '{service_path}'. Skipping save."
@@ -369,19 +676,18 @@ class FaissService:
             # Get the FAISS ID for this service
             service_id = self.metadata_store[service_path].get("id")
             if service_id is not None and self.faiss_index:
-                # Remove from FAISS index
-                # Note: FAISS doesn't support direct removal, but we can remove from metadata
-                # The vector will remain in the index but won't be accessible via metadata
+                # The vector is dropped from the index with the next save
                 logger.info(
                     f"Removing service '{service_path}' with FAISS ID {service_id} from index"
                 )
+                self._tombstone_faiss_id(service_id)
 
             # Remove from metadata store
             del self.metadata_store[service_path]
             logger.info(f"Removed service '{service_path}' from FAISS metadata store")
 
             # Save the updated metadata
-            await self.save_data()
+            self._schedule_save()
 
         except Exception as e:
             logger.error(
@@ -430,41 +736,21 @@ class FaissService:
 
         if needs_new_embedding:
             try:
-                # Run model encoding in a separate thread
-                embedding = await asyncio.to_thread(
-                    self.embedding_model.encode,
-                    [text_to_embed],
-                )
-                embedding_np = np.array([embedding[0]], dtype=np.float32)
+                # Reuse a cached vector or encode batched with any concurrent requests
+                embedding = await self._embed_text(text_to_embed)
 
                 # Normalize embedding for cosine similarity (IndexFlatIP)
-                normalized_embedding = self._normalize_embedding(embedding_np[0])
-                embedding_np = np.array([normalized_embedding], dtype=np.float32)
-                logger.debug(
-                    f"Normalized embedding for '{agent_path}' (norm check: {np.linalg.norm(normalized_embedding):.4f})"
-                )
+                embedding_np = self._normalize_embedding(np.asarray(embedding).reshape(1, -1))
 
-                ids_to_remove = np.array([current_faiss_id])
                 if existing_entry:
-                    try:
-                        num_removed = self.faiss_index.remove_ids(ids_to_remove)
-                        if num_removed > 0:
-                            logger.info(
-                                f"Removed {num_removed} old vector(s) for FAISS ID {current_faiss_id} ({agent_path})."
-                            )
-                        else:
-                            logger.info(
-                                f"No old vector found for FAISS ID {current_faiss_id} ({agent_path}) during update, or ID not in index."
-                            )
-                    except Exception as e_remove:
-                        logger.warning(
-                            f"Issue removing FAISS ID {current_faiss_id} for {agent_path}: {e_remove}. Proceeding to add."
-                        )
+                    # Re-embed under a fresh id; the old vector is removed in bulk on save
+                    current_faiss_id = self.next_id_counter
+                    self.next_id_counter += 1
 
-                self.faiss_index.add_with_ids(
-                    embedding_np,
-                    np.array([current_faiss_id]),
-                )
+                with self._index_lock:
+                    self.faiss_index.add_with_ids(
+                        embedding_np, np.array([current_faiss_id], dtype=np.int64)
+                    )
                 logger.info(
                     f"Added/Updated vector for '{agent_path}' with FAISS ID {current_faiss_id}."
                 )
@@ -475,6 +761,18 @@ class FaissService:
                 )
                 return
 
+        # Fingerprint the card so an unchanged card skips building its dict
+        agent_hash = _content_hash(agent_card.model_dump_json().encode())
+        if (
+            existing_entry is not None
+            and not needs_new_embedding
+            and existing_entry.get("agent_hash") == agent_hash
+        ):
+            logger.debug(
+                f"No changes to FAISS vector or agent card for '{agent_path}'. Skipping save."
+            )
+            return
+
         # Update metadata store
         agent_card_dict = agent_card.model_dump()
 
@@ -483,15 +781,19 @@ class FaissService:
             or needs_new_embedding
             or existing_entry.get("full_agent_card") != agent_card_dict
         ):
+            self._claim_faiss_id(agent_path, current_faiss_id)
             self.metadata_store[agent_path] = {
                 "id": current_faiss_id,
                 "entity_type": "a2a_agent",
                 "text_for_embedding": text_to_embed,
                 "full_agent_card": agent_card_dict,
+                "agent_hash": agent_hash,
             }
             logger.debug(f"Updated faiss_metadata_store for agent '{agent_path}'.")
-            await self.save_data()
+            self._schedule_save()
         else:
+            # Entry predates fingerprints; record it so the next update takes the fast path
+            existing_entry["agent_hash"] = agent_hash
             logger.debug(
                 f"No changes to FAISS vector or agent card for '{agent_path}'. Skipping save."
             )
@@ -508,13 +810,14 @@ class FaissService:
             agent_id = self.metadata_store[agent_path].get("id")
             if agent_id is not None and self.faiss_index:
                 logger.info(f"Removing agent '{agent_path}' with FAISS ID {agent_id} from index")
+                self._tombstone_faiss_id(agent_id)
 
             # Remove from metadata store
             del self.metadata_store[agent_path]
             logger.info(f"Removed agent '{agent_path}' from FAISS metadata store")
 
             # Save the updated metadata
-            await self.save_data()
+            self._schedule_save()
 
         except Exception as e:
             logger.error(
@@ -545,13 +848,23 @@ class FaissService:
         """
         Wrapper method for adding or updating an entity.
 
-        Routes agents to appropriate methods based on entity_type.
+        Routes agents and servers to their methods based on entity_type.
         """
-        if entity_type == "a2a_agent":
-            agent_card = AgentCard(**entity_info)
-            await self.add_or_update_agent(entity_path, agent_card, is_enabled)
-        elif entity_type == "mcp_server":
-            await self.add_or_update_service(entity_path, entity_info, is_enabled)
+        handler = self._add_handlers.get(entity_type)
+        if handler is None:
+            logger.debug(f"No FAISS indexing for entity type '{entity_type}': {entity_path}")
+            return
+
+        await handler(entity_path, entity_info, is_enabled)
+
+    async def _add_or_update_agent_info(
+        self,
+        agent_path: str,
+        agent_info: dict[str, Any],
+        is_enabled: bool = False,
+    ) -> None:
+        """Build an AgentCard from a plain dict and add or update it."""
+        await self.add_or_update_agent(agent_path, AgentCard(**agent_info), is_enabled)
 
     async def remove_entity(
         self,
@@ -560,15 +873,12 @@ class FaissService:
         """
         Wrapper method for removing an entity.
 
-        Attempts to remove as agent first, then server.
+        Routes on the entity_type recorded in the metadata store. Servers and
+        any other indexed type share the service removal path.
         """
-        try:
-            await self.remove_agent(entity_path)
-        except Exception:
-            try:
-                await self.remove_service(entity_path)
-            except Exception as e:
-                logger.warning(f"Could not remove entity {entity_path}: {e}")
+        entity_type = self.metadata_store.get(entity_path, {}).get("entity_type")
+        handler = self._remove_handlers.get(entity_type, self.remove_service)
+        await handler(entity_path)
 
     async def search_entities(
         self,
@@ -611,82 +921,56 @@ class FaissService:
 
         return combined[:max_results]
 
-    def _distance_to_relevance(self, distance: float) -> float:
-        """Convert FAISS Inner Product distance to cosine similarity score (0-1).
-
-        FAISS IndexFlatIP behavior depends on index configuration:
-        - Standard IndexFlatIP: Returns (1 - inner_product) as distance
-          Example: inner_product=0.95 → distance=0.05 → similarity=0.95
-        - With negated scores: Returns -inner_product as distance
-          Example: inner_product=0.95 → distance=-0.95 → similarity=0.95
-
-        For normalized vectors: inner_product = cosine_similarity
-
-        This function handles both cases:
-        - Positive distances (0 to 1): similarity = 1 - distance
-        - Negative distances (-1 to 0): similarity = -distance
+    def _search_index(
+        self,
+        query_np: np.ndarray,
+        top_k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run a FAISS search while holding the index lock."""
+        with self._index_lock:
+            return self.faiss_index.search(query_np, top_k)
+
+    def _similarity_to_relevance(
+        self,
+        similarity: float | np.ndarray,
+    ) -> float | np.ndarray:
+        """Convert FAISS IndexFlatIP scores to relevance scores (0-1).
 
-        Expected behavior:
-        - distance=0.05 → similarity=0.95 (95% match)
-        - distance=-0.95 → similarity=0.95 (95% match)
-        - distance=0.50 → similarity=0.50 (50% match)
-        - distance=-0.50 → similarity=0.50 (50% match)
+        IndexFlatIP returns the inner product itself, with higher meaning more
+        similar. For unit-length vectors that is the cosine similarity, so
+        the only conversion needed is clamping negative (dissimilar) scores
+        to zero. An array of scores is clamped in one vectorized call.
 
         Args:
-            distance: Distance from FAISS IndexFlatIP
+            similarity: Inner product score, or array of scores, from FAISS IndexFlatIP
 
         Returns:
-            Cosine similarity score in range 0-1
+            Cosine similarity score(s) in range 0-1
         """
-        try:
-            dist = float(distance)
-
-            # Handle both positive and negative distance conventions
-            if dist < 0:
-                # Negative distance: negate to get similarity
-                similarity = -dist
-            else:
-                # Positive distance: convert from (1-IP) to similarity
-                similarity = 1.0 - dist
-
-            # Clamp to 0-1 range (handle edge cases)
-            clamped_similarity = max(0.0, min(1.0, similarity))
-
-            # Log conversion for debugging
-            logger.info(
-                f"IP-to-similarity conversion: "
-                f"faiss_distance={distance:.4f}, similarity={similarity:.4f}, "
-                f"clamped={clamped_similarity:.4f}, percentage={clamped_similarity * 100:.1f}%"
-            )
-
-            return clamped_similarity
-        except Exception as e:
-            logger.error(
-                f"Error in _distance_to_relevance: faiss_distance={distance}, exception={str(e)}",
-                exc_info=True,
-            )
-            return 0.0
+        if isinstance(similarity, np.ndarray):
+            return np.clip(similarity, 0.0, 1.0)
+        return min(1.0, max(0.0, float(similarity)))
 
     def _normalize_embedding(
         self,
         embedding: np.ndarray,
     ) -> np.ndarray:
-        """Normalize embedding vector to unit length for cosine similarity.
+        """Normalize embedding vectors to unit length for cosine similarity.
 
-        Converts any embedding vector to unit length (L2 norm = 1).
-        This allows FAISS IndexFlatIP to compute cosine similarity via inner product.
+        Accepts a single vector or a (n, d) batch and returns a float32 copy of
+        the same shape with each row scaled to L2 norm 1, so FAISS IndexFlatIP
+        computes cosine similarity via inner product. Zero vectors are left
+        unchanged.
 
         Args:
-            embedding: Input embedding vector (numpy array)
+            embedding: Input embedding vector or batch (numpy array)
 
         Returns:
-            Normalized embedding with L2 norm = 1
+            Normalized embedding(s) with L2 norm = 1
         """
-        norm = np.linalg.norm(embedding)
-        if norm == 0:
-            logger.warning("Zero-norm embedding detected, returning as-is")
-            return embedding
-        return embedding / norm
+        vectors = np.array(embedding, dtype=np.float32, ndmin=2)
+        faiss.normalize_L2(vectors)
+        return vectors.reshape(np.shape(embedding))
 
     def _calculate_keyword_boost(
         self,
@@ -708,62 +992,8 @@ class FaissService:
         Returns:
             Boost multiplier (1.0 = no boost, up to 2.0 = maximum boost)
         """
-        # Filter out stopwords to prevent false matches
-        stopwords = {
-            "a",
-            "an",
-            "the",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "can",
-            "to",
-            "of",
-            "in",
-            "on",
-            "at",
-            "by",
-            "for",
-            "with",
-            "about",
-            "as",
-            "into",
-            "through",
-            "from",
-            "what",
-            "when",
-            "where",
-            "who",
-            "which",
-            "how",
-            "why",
-            "get",
-            "set",
-            "put",
-        }
 
-        query_lower = query.lower()
-        query_tokens = set(
-            token
-            for token in re.split(r"\W+", query_lower)
-            if token and len(token) > 2 and token not in stopwords
-        )
+        query_tokens = set(_tokenize_query(query))
 
         if not query_tokens:
             return 1.0
@@ -794,7 +1024,11 @@ class FaissService:
 
         # Tag matches: +0.2 boost per matching tag (max +0.4)
         tags = server_info.get("tags", [])
-        tag_matches = sum(1 for tag in tags if any(token in tag.lower() for token in query_tokens))
+        tag_matches = 0
+        for tag in tags:
+            tag_lower = tag.lower()
+            if any(token in tag_lower for token in query_tokens):
+                tag_matches += 1
         tag_boost = min(0.4, tag_matches * 0.2)
         if tag_boost > 0:
             boost += tag_boost
@@ -840,67 +1074,13 @@ class FaissService:
         if not tools:
             return []
 
-        # Filter out stopwords and short tokens to improve matching quality
-        stopwords = {
-            "a",
-            "an",
-            "the",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "can",
-            "to",
-            "of",
-            "in",
-            "on",
-            "at",
-            "by",
-            "for",
-            "with",
-            "about",
-            "as",
-            "into",
-            "through",
-            "from",
-            "what",
-            "when",
-            "where",
-            "who",
-            "which",
-            "how",
-            "why",
-            "get",
-            "set",
-            "put",
-        }
-
-        tokens = [
-            token
-            for token in re.split(r"\W+", query.lower())
-            if token and len(token) > 2 and token not in stopwords
-        ]
+        tokens = _tokenize_query(query)
         if not tokens:
             return []
 
         # Check if query contains server name - if so, include all tools
         server_name = server_info.get("server_name", "").lower()
-        server_name_tokens = [t for t in re.split(r"\W+", server_name) if t and len(t) > 2]
+        server_name_tokens = [t for t in _WORD_RE.findall(server_name) if len(t) > 2]
         server_name_match = any(
             token in server_name or any(snt in token or token in snt for snt in server_name_tokens)
             for token in tokens
@@ -923,16 +1103,15 @@ class FaissService:
             tool_desc = tool_desc or ""
             tool_args = tool_args or ""
 
-            searchable_text = f"{tool_name} {tool_desc} {tool_args}".lower()
-            if not searchable_text.strip():
+            # Lowercase once per tool rather than once per query token
+            tool_name_lower = tool_name.lower()
+            desc_lower = f"{tool_desc} {tool_args}".lower()
+            if not tool_name_lower.strip() and not desc_lower.strip():
                 continue
 
             # Calculate matches with higher weight for tool name matches
-            tool_name_lower = tool_name.lower()
             name_matches = sum(1 for token in tokens if token in tool_name_lower)
-            desc_matches = sum(
-                1 for token in tokens if token in tool_desc.lower() or token in tool_args.lower()
-            )
+            desc_matches = sum(1 for token in tokens if token in desc_lower)
 
             # Weight tool name matches more heavily (2x)
             weighted_matches = (name_matches * 2.0) + desc_matches
@@ -974,7 +1153,7 @@ class FaissService:
                 )
             )
 
-        matches.sort(key=lambda item: item[0], reverse=True)
+        matches.sort(key=_match_score_key, reverse=True)
         return [match for _, match in matches]
 
     async def search_mixed(
@@ -1011,40 +1190,41 @@ class FaissService:
         if total_vectors == 0:
             return {"servers": [], "tools": [], "agents": []}
 
-        top_k = min(max_results, total_vectors)
-        query_embedding = await asyncio.to_thread(self.embedding_model.encode, [query.strip()])
-        query_np = np.array([query_embedding[0]], dtype=np.float32)
+        # Over-fetch by the number of stale vectors still in the index
+        top_k = min(max_results + len(self._tombstoned_ids), total_vectors)
+        query_embedding = await self._encode_batcher.encode(query.strip())
 
         # Normalize query embedding for cosine similarity (IndexFlatIP)
-        normalized_query = self._normalize_embedding(query_np[0])
-        query_np = np.array([normalized_query], dtype=np.float32)
-        logger.debug(
-            f"Normalized query embedding (norm check: {np.linalg.norm(normalized_query):.4f})"
-        )
-
-        distances, indices = self.faiss_index.search(query_np, top_k)
-        distance_row = distances[0]
-        id_row = indices[0]
+        query_np = self._normalize_embedding(np.asarray(query_embedding).reshape(1, -1))
 
-        id_to_path = {entry.get("id"): path for path, entry in self.metadata_store.items()}
+        # FAISS releases the GIL, so searching off the event loop keeps other requests moving
+        similarities, indices = await asyncio.to_thread(self._search_index, query_np, top_k)
+        # Drop empty slots (-1), score every hit at once, then convert to Python scalars
+        valid_mask = indices[0] != -1
+        id_row = indices[0][valid_mask].tolist()
+        valid_similarities = similarities[0][valid_mask]
+        relevance_row = self._similarity_to_relevance(valid_similarities).tolist()
+        similarity_row = valid_similarities.tolist()
 
         server_results: list[dict[str, Any]] = []
         tool_results: list[dict[str, Any]] = []
         agent_results: list[dict[str, Any]] = []
 
-        for distance, faiss_id in zip(distance_row, id_row, strict=False):
-            if faiss_id == -1:
-                continue
-
-            path = id_to_path.get(int(faiss_id))
+        for similarity, base_relevance, faiss_id in zip(
+            similarity_row, relevance_row, id_row, strict=True
+        ):
+            path = self._id_to_path.get(faiss_id)
             if not path:
                 continue
 
             metadata_entry = self.metadata_store.get(path, {})
             entity_type = metadata_entry.get("entity_type", "mcp_server")
-            base_relevance = self._distance_to_relevance(distance)
 
             if entity_type == "mcp_server":
+                # Server hits only feed server and tool results; skip scoring otherwise
+                if "mcp_server" not in entity_filter and "tool" not in entity_filter:
+                    continue
+
                 server_info = metadata_entry.get("full_server_info", {})
                 if not server_info:
                     continue
@@ -1066,7 +1246,7 @@ class FaissService:
                 # Comprehensive trace for search debugging
                 logger.info(
                     f"[SEARCH] Server: {server_info.get('server_name')} | "
-                    f"Distance: {distance:.4f} | "
+                    f"Similarity: {similarity:.4f} | "
                     f"Base Similarity: {base_relevance:.2%} | "
                     f"Keyword Boost: {keyword_boost:.2f}x | "
                     f"Final Score: {relevance:.2%} | "
@@ -1129,36 +1309,36 @@ class FaissService:
                 if not agent_card:
                     continue
 
-                # Apply keyword boost for agents (using base_relevance from line 831)
+                # Look up each card field once for boosting, context and the result
+                agent_description = agent_card.get("description", "")
+                agent_tags = agent_card.get("tags", [])
+
+                # One pass over the stored skills yields names for the result and the boost
+                skills = []
+                skill_tools = []
+                for skill in agent_card.get("skills", []):
+                    if isinstance(skill, dict):
+                        skill_name = skill.get("name")
+                        skills.append(skill_name)
+                        skill_tools.append({"name": skill_name or ""})
+
+                # Apply keyword boost for agents
                 # For agents, check name, description, skills, and tags
                 agent_info_for_boost = {
                     "server_name": agent_card.get("name", ""),
-                    "description": agent_card.get("description", ""),
-                    "tags": agent_card.get("tags", []),
-                    "tool_list": [
-                        {"name": skill.get("name", "")}
-                        for skill in agent_card.get("skills", [])
-                        if isinstance(skill, dict)
-                    ],
+                    "description": agent_description,
+                    "tags": agent_tags,
+                    "tool_list": skill_tools,
                 }
                 keyword_boost = self._calculate_keyword_boost(query, agent_info_for_boost)
                 agent_relevance = min(1.0, base_relevance * keyword_boost)
 
-                skills = [
-                    skill.get("name")
-                    for skill in agent_card.get("skills", [])
-                    if isinstance(skill, dict)
-                ]
-                match_context = (
-                    agent_card.get("description")
-                    or ", ".join(skills)
-                    or ", ".join(agent_card.get("tags", []))
-                )
+                match_context = agent_description or ", ".join(skills) or ", ".join(agent_tags)
 
                 # Comprehensive trace for agent search debugging
                 logger.info(
                     f"[SEARCH] Agent: {agent_card.get('name')} | "
-                    f"Distance: {distance:.4f} | "
+                    f"Similarity: {similarity:.4f} | "
                     f"Base Similarity: {base_relevance:.2%} | "
                     f"Keyword Boost: {keyword_boost:.2f}x | "
                     f"Final Score: {agent_relevance:.2%} | "
@@ -1170,8 +1350,8 @@ class FaissService:
                         "entity_type": "a2a_agent",
                         "path": path,
                         "agent_name": agent_card.get("name", path.strip("/")),
-                        "description": agent_card.get("description", ""),
-                        "tags": agent_card.get("tags", []),
+                        "description": agent_description,
+                        "tags": agent_tags,
                         "skills": skills,
                         "visibility": agent_card.get("visibility", "public"),
                         "trust_level": agent_card.get("trust_level"),
@@ -1182,14 +1362,11 @@ class FaissService:
                     }
                 )
 
-        server_results.sort(key=lambda item: item["relevance_score"], reverse=True)
-        tool_results.sort(key=lambda item: item["relevance_score"], reverse=True)
-        agent_results.sort(key=lambda item: item["relevance_score"], reverse=True)
-
+        # Partial top-K selection; equal scores keep their FAISS order like a stable sort
         return {
-            "servers": server_results[:max_results],
-            "tools": tool_results[:max_results],
-            "agents": agent_results[:max_results],
+            "servers": heapq.nlargest(max_results, server_results, key=_relevance_key),
+            "tools": heapq.nlargest(max_results, tool_results, key=_relevance_key),
+            "agents": heapq.nlargest(max_results, agent_results, key=_relevance_key),
         }
 
 
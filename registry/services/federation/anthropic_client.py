@@ -6,6 +6,7 @@ and transforms them to the gateway's internal format.
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 from urllib.parse import quote
@@ -77,7 +78,7 @@ class AnthropicFederationClient(BaseFederationClient):
         return self._transform_server_response(response, server_name, server_config)
 
     def fetch_all_servers(
-        self, server_configs: list[AnthropicServerConfig]
+        self, server_configs: Sequence[AnthropicServerConfig]
     ) -> list[dict[str, Any]]:
         """
         Fetch multiple servers from Anthropic Registry.
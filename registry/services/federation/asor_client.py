@@ -7,6 +7,7 @@ to the gateway's internal format.
 
 import logging
 import os
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -255,7 +256,7 @@ class AsorFederationClient(BaseFederationClient):
 
         return agents
 
-    def fetch_all_agents(self, agent_configs: list[AsorAgentConfig]) -> list[dict[str, Any]]:
+    def fetch_all_agents(self, agent_configs: Sequence[AsorAgentConfig]) -> list[dict[str, Any]]:
         """
         Fetch multiple agents from ASOR.
 
@@ -8,6 +8,7 @@ loading large ML models during tests.
 import hashlib
 import logging
 from typing import Any
+from unittest.mock import AsyncMock
 
 import numpy as np
 
@@ -76,6 +77,23 @@ class MockEmbeddingsClient:
         logger.debug(f"Generated {len(texts)} mock embeddings, shape={result.shape}")
         return result
 
+    async def encode_async(
+        self,
+        texts: str | list[str],
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """
+        Async variant of encode, matching EmbeddingsClient.encode_async.
+
+        Args:
+            texts: Single text string or list of texts
+            **kwargs: Additional arguments passed to encode
+
+        Returns:
+            Array of embeddings (shape: [n, dimension])
+        """
+        return self.encode(texts, **kwargs)
+
     def _generate_embedding(self, text: str) -> np.ndarray:
         """
         Generate a deterministic embedding from text.
@@ -204,4 +222,7 @@ def create_mock_litellm_module() -> Any:
             logger.debug(f"Mock LiteLLM generated {len(embeddings)} embeddings")
             return MockLiteLLMModule.MockEmbeddingResponse(embeddings)
 
+        # Async counterpart awaited by LiteLLMClient.encode_async
+        aembedding = AsyncMock(side_effect=embedding)
+
     return MockLiteLLMModule()
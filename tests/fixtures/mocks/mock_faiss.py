@@ -6,6 +6,7 @@ loading the actual FAISS library during tests.
 """
 
 import logging
+from pathlib import Path
 from typing import Any
 
 import numpy as np
@@ -21,14 +22,16 @@ class MockFaissIndex:
     FAISS library to be loaded.
     """
 
-    def __init__(self, dimension: int = 384):
+    def __init__(self, dimension: int = 384, metric: str = "l2"):
         """
         Initialize mock FAISS index.
 
         Args:
             dimension: Dimension of the embeddings
+            metric: "l2" for ascending distances, "ip" for descending inner products
         """
         self.dimension = dimension
+        self.metric = metric
         self._vectors: dict[int, np.ndarray] = {}
         self._next_id: int = 0
         logger.debug(f"Created MockFaissIndex with dimension {dimension}")
@@ -87,7 +90,8 @@ class MockFaissIndex:
             k: Number of nearest neighbors to return
 
         Returns:
-            Tuple of (distances, indices) arrays
+            Tuple of (distances, indices) arrays. For the "ip" metric the first
+            array holds inner products, highest first, as FAISS IndexFlatIP does.
         """
         if query_vectors.shape[1] != self.dimension:
             raise ValueError(
@@ -97,9 +101,12 @@ class MockFaissIndex:
         n_queries = query_vectors.shape[0]
         n_vectors = self.ntotal
 
+        # Padding value for missing results matches FAISS for each metric
+        pad = float("-inf") if self.metric == "ip" else float("inf")
+
         if n_vectors == 0:
             # No vectors in index, return empty results
-            distances = np.full((n_queries, k), float("inf"), dtype=np.float32)
+            distances = np.full((n_queries, k), pad, dtype=np.float32)
             indices = np.full((n_queries, k), -1, dtype=np.int64)
             return distances, indices
 
@@ -111,15 +118,21 @@ class MockFaissIndex:
         indices_list = []
 
         for query_vector in query_vectors:
-            # Calculate L2 distances
-            dists = np.linalg.norm(all_vectors - query_vector, axis=1)
+            if self.metric == "ip":
+                # Inner products, best match first
+                dists = all_vectors @ query_vector
+                order = np.argsort(-dists)
+            else:
+                # Calculate L2 distances
+                dists = np.linalg.norm(all_vectors - query_vector, axis=1)
+                order = np.argsort(dists)
 
             # Get top k
             k_actual = min(k, len(dists))
-            top_k_indices = np.argsort(dists)[:k_actual]
+            top_k_indices = order[:k_actual]
 
             # Build result arrays
-            result_distances = np.full(k, float("inf"), dtype=np.float32)
+            result_distances = np.full(k, pad, dtype=np.float32)
             result_indices = np.full(k, -1, dtype=np.int64)
 
             result_distances[:k_actual] = dists[top_k_indices]
@@ -187,6 +200,11 @@ class MockIndexIDMap:
         """Get the total number of vectors."""
         return self.index.ntotal
 
+    @property
+    def id_map(self) -> np.ndarray:
+        """Get the IDs stored in the index."""
+        return np.array(list(self.index._vectors.keys()), dtype=np.int64)
+
     def add_with_ids(self, vectors: np.ndarray, ids: np.ndarray) -> None:
         """Add vectors with IDs."""
         self.index.add_with_ids(vectors, ids)
@@ -215,9 +233,19 @@ def create_mock_faiss_module() -> Any:
         Mock FAISS module object
     """
 
+    class MockScalarQuantizer:
+        """Mock of faiss.ScalarQuantizer quantizer type constants."""
+
+        QT_8bit = 0
+        QT_fp16 = 3
+
     class MockFaissModule:
         """Mock FAISS module."""
 
+        METRIC_INNER_PRODUCT = 0
+        METRIC_L2 = 1
+        ScalarQuantizer = MockScalarQuantizer
+
         @staticmethod
         def IndexFlatL2(d: int) -> MockFaissIndex:
             """Create a flat L2 index."""
@@ -228,7 +256,13 @@ def create_mock_faiss_module() -> Any:
         def IndexFlatIP(d: int) -> MockFaissIndex:
             """Create a flat Inner Product index (for cosine similarity)."""
             logger.debug(f"Creating MockFaissIndex (IP) with dimension {d}")
-            return MockFaissIndex(d)
+            return MockFaissIndex(d, metric="ip")
+
+        @staticmethod
+        def IndexScalarQuantizer(d: int, qtype: int, metric: int = 1) -> MockFaissIndex:
+            """Create a scalar-quantized index (stored at full precision in the mock)."""
+            logger.debug(f"Creating MockFaissIndex (SQ type {qtype}) with dimension {d}")
+            return MockFaissIndex(d, metric="ip" if metric == 0 else "l2")
 
         @staticmethod
         def IndexIDMap(index: MockFaissIndex) -> MockIndexIDMap:
@@ -237,18 +271,41 @@ def create_mock_faiss_module() -> Any:
             return MockIndexIDMap(index)
 
         @staticmethod
-        def read_index(filepath: str) -> MockFaissIndex:
+        def normalize_L2(x: np.ndarray) -> None:
+            """L2-normalize the rows of a float32 array in place, skipping zero rows."""
+            norms = np.linalg.norm(x, axis=1, keepdims=True)
+            np.divide(x, norms, out=x, where=norms > 0)
+
+        @staticmethod
+        def omp_set_num_threads(num_threads: int) -> None:
+            """Mock omp_set_num_threads that does nothing."""
+            logger.debug(f"Mock setting FAISS OpenMP threads to {num_threads}")
+
+        @staticmethod
+        def read_index(filepath: str) -> MockIndexIDMap:
             """
-            Mock read_index that returns an empty index.
+            Mock read_index that returns an empty ID-mapped index.
 
             In real tests, the index will be populated separately.
             """
             logger.debug(f"Mock reading FAISS index from {filepath}")
-            return MockFaissIndex()
+            return MockIndexIDMap(MockFaissIndex())
+
+        @staticmethod
+        def serialize_index(index: MockFaissIndex) -> np.ndarray:
+            """Mock serialize_index that returns an empty byte array."""
+            logger.debug("Mock serializing FAISS index")
+            return np.zeros(0, dtype=np.uint8)
+
+        @staticmethod
+        def vector_to_array(vector: np.ndarray) -> np.ndarray:
+            """Mock vector_to_array that returns the vector as a numpy array."""
+            return np.asarray(vector)
 
         @staticmethod
         def write_index(index: MockFaissIndex, filepath: str) -> None:
-            """Mock write_index that does nothing."""
+            """Mock write_index that creates an empty placeholder file."""
             logger.debug(f"Mock writing FAISS index to {filepath}")
+            Path(filepath).touch()
 
     return MockFaissModule()
@@ -0,0 +1,298 @@
+"""
+Unit tests for registry/api/federation_routes.py
+
+Tests the federation config endpoints including:
+- POST/DELETE /api/federation/config/{config_id}/anthropic/servers - Manage Anthropic servers
+- POST/DELETE /api/federation/config/{config_id}/asor/agents - Manage ASOR agents
+- POST /api/federation/sync - Sync servers and agents from federation sources
+"""
+
+import logging
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from registry.repositories.file.federation_config_repository import (
+    FileFederationConfigRepository,
+    _load_config_file,
+)
+from registry.schemas.federation_schema import FederationConfig
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def admin_user_context() -> dict[str, Any]:
+    """Create admin user context."""
+    return {
+        "username": "admin",
+        "is_admin": True,
+        "groups": ["mcp-registry-admin"],
+        "scopes": [],
+        "auth_method": "session",
+    }
+
+
+@pytest.fixture
+def federation_repository(tmp_path: Path) -> FileFederationConfigRepository:
+    """Create a file repository backed by a temporary directory."""
+    _load_config_file.cache_clear()
+    return FileFederationConfigRepository(config_dir=tmp_path)
+
+
+@pytest.fixture
+async def seeded_repository(federation_repository) -> FileFederationConfigRepository:
+    """Seed the repository with a config holding one server and one agent."""
+    await federation_repository.save_config(
+        FederationConfig(
+            anthropic={"enabled": True, "servers": [{"name": "io.github/fetch"}]},
+            asor={"agents": [{"id": "agent-1"}]},
+        )
+    )
+    return federation_repository
+
+
+@pytest.fixture
+def client(admin_user_context, federation_repository):
+    """Create a test client with auth and the federation repository overridden."""
+    from registry.api.federation_routes import _get_federation_repo
+    from registry.auth.dependencies import nginx_proxied_auth
+    from registry.main import app
+
+    app.dependency_overrides[nginx_proxied_auth] = lambda: admin_user_context
+    app.dependency_overrides[_get_federation_repo] = lambda: federation_repository
+
+    yield TestClient(app)
+
+    app.dependency_overrides.clear()
+
+
+# =============================================================================
+# ANTHROPIC SERVER ROUTES
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAnthropicServerRoutes:
+    """Tests for adding and removing Anthropic servers in a federation config."""
+
+    @pytest.mark.asyncio
+    async def test_add_server_saves_config(self, client, seeded_repository):
+        """Adding a server should append it to the saved config."""
+        response = client.post(
+            "/api/federation/config/default/anthropic/servers",
+            params={"server_name": "ai.smithery/github"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        saved = await seeded_repository.get_config()
+        assert [s.name for s in saved.anthropic.servers] == [
+            "io.github/fetch",
+            "ai.smithery/github",
+        ]
+        assert saved.anthropic.enabled is True
+        assert [a.id for a in saved.asor.agents] == ["agent-1"]
+
+    @pytest.mark.asyncio
+    async def test_add_duplicate_server_rejected(self, client, seeded_repository):
+        """Adding a server that is already configured should return 400."""
+        response = client.post(
+            "/api/federation/config/default/anthropic/servers",
+            params={"server_name": "io.github/fetch"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        saved = await seeded_repository.get_config()
+        assert [s.name for s in saved.anthropic.servers] == ["io.github/fetch"]
+
+    @pytest.mark.asyncio
+    async def test_remove_server_saves_config(self, client, seeded_repository):
+        """Removing a server should drop it from the saved config."""
+        mock_server_service = AsyncMock()
+        mock_server_service.get_server_info.return_value = None
+
+        with patch("registry.services.server_service.server_service", mock_server_service):
+            response = client.delete(
+                "/api/federation/config/default/anthropic/servers/io.github/fetch"
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["server_removed_from_registry"] is False
+        saved = await seeded_repository.get_config()
+        assert saved.anthropic.servers == ()
+        assert [a.id for a in saved.asor.agents] == ["agent-1"]
+
+    @pytest.mark.asyncio
+    async def test_remove_unknown_server_returns_404(self, client, seeded_repository):
+        """Removing a server that is not configured should return 404."""
+        response = client.delete("/api/federation/config/default/anthropic/servers/missing")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_add_server_to_missing_config_returns_404(self, client):
+        """Adding a server to a config that does not exist should return 404."""
+        response = client.post(
+            "/api/federation/config/missing/anthropic/servers",
+            params={"server_name": "io.github/fetch"},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# =============================================================================
+# ASOR AGENT ROUTES
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestAsorAgentRoutes:
+    """Tests for adding and removing ASOR agents in a federation config."""
+
+    @pytest.mark.asyncio
+    async def test_add_agent_saves_config(self, client, seeded_repository):
+        """Adding an agent should append it to the saved config."""
+        response = client.post(
+            "/api/federation/config/default/asor/agents",
+            params={"agent_id": "agent-2"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        saved = await seeded_repository.get_config()
+        assert [a.id for a in saved.asor.agents] == ["agent-1", "agent-2"]
+        assert [s.name for s in saved.anthropic.servers] == ["io.github/fetch"]
+
+    @pytest.mark.asyncio
+    async def test_add_duplicate_agent_rejected(self, client, seeded_repository):
+        """Adding an agent that is already configured should return 400."""
+        response = client.post(
+            "/api/federation/config/default/asor/agents",
+            params={"agent_id": "agent-1"},
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_remove_agent_saves_config(self, client, seeded_repository):
+        """Removing an agent should drop it from the saved config."""
+        response = client.delete("/api/federation/config/default/asor/agents/agent-1")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["config"]["asor"]["agents"] == []
+        saved = await seeded_repository.get_config()
+        assert saved.asor.agents == ()
+        assert [s.name for s in saved.anthropic.servers] == ["io.github/fetch"]
+
+    @pytest.mark.asyncio
+    async def test_remove_unknown_agent_returns_404(self, client, seeded_repository):
+        """Removing an agent that is not configured should return 404."""
+        response = client.delete("/api/federation/config/default/asor/agents/missing")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# =============================================================================
+# SYNC ROUTE
+# =============================================================================
+
+
+@pytest.fixture
+async def both_sources_repository(federation_repository) -> FileFederationConfigRepository:
+    """Seed the repository with a config that enables both federation sources."""
+    await federation_repository.save_config(
+        FederationConfig(
+            anthropic={"enabled": True, "servers": [{"name": "io.github/fetch"}]},
+            asor={
+                "enabled": True,
+                "endpoint": "https://asor.example.com/api",
+                "agents": [{"id": "agent-1"}],
+            },
+        )
+    )
+    return federation_repository
+
+
+@pytest.fixture
+def mock_sync_services():
+    """Patch the server service and reconciliation used after fetching."""
+    mock_server_service = AsyncMock()
+    mock_server_service.register_server.return_value = {"success": True}
+
+    with (
+        patch("registry.services.server_service.server_service", mock_server_service),
+        patch(
+            "registry.services.federation_reconciliation.reconcile_anthropic_servers",
+            new_callable=AsyncMock,
+            return_value={},
+        ),
+        patch("registry.repositories.factory.get_server_repository"),
+    ):
+        yield mock_server_service
+
+
+@pytest.mark.unit
+class TestSyncFederation:
+    """Tests for POST /api/federation/sync."""
+
+    @pytest.mark.asyncio
+    async def test_failing_source_does_not_discard_other_source(
+        self, client, both_sources_repository, mock_sync_services
+    ):
+        """Servers from Anthropic should register even when the ASOR fetch fails."""
+        from registry.services.federation.anthropic_client import AnthropicFederationClient
+        from registry.services.federation.asor_client import AsorFederationClient
+
+        server_data = {"path": "/io.github-fetch", "server_name": "io.github/fetch"}
+
+        with (
+            patch.object(
+                AnthropicFederationClient, "fetch_all_servers", return_value=[server_data]
+            ),
+            patch.object(
+                AsorFederationClient,
+                "fetch_all_agents",
+                side_effect=RuntimeError("ASOR unavailable"),
+            ),
+        ):
+            response = client.post("/api/federation/sync")
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert results["anthropic"]["servers"] == ["io.github/fetch"]
+        assert results["asor"]["count"] == 0
+        assert results["asor"]["error"] == "ASOR unavailable"
+        mock_sync_services.register_server.assert_awaited_once()
+        mock_sync_services.toggle_service.assert_awaited_once_with("/io.github-fetch", True)
+
+    @pytest.mark.asyncio
+    async def test_all_sources_failing_returns_500(
+        self, client, both_sources_repository, mock_sync_services
+    ):
+        """The sync should fail when no source could be fetched."""
+        from registry.services.federation.anthropic_client import AnthropicFederationClient
+        from registry.services.federation.asor_client import AsorFederationClient
+
+        with (
+            patch.object(
+                AnthropicFederationClient,
+                "fetch_all_servers",
+                side_effect=RuntimeError("registry unavailable"),
+            ),
+            patch.object(
+                AsorFederationClient,
+                "fetch_all_agents",
+                side_effect=RuntimeError("ASOR unavailable"),
+            ),
+        ):
+            response = client.post("/api/federation/sync")
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        mock_sync_services.register_server.assert_not_awaited()
@@ -11,7 +11,7 @@ This module tests the embeddings client abstraction including:
 import logging
 import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -155,6 +155,24 @@ class TestEmbeddingsClient:
         assert isinstance(client, EmbeddingsClient)
         assert client.get_embedding_dimension() == 3
 
+    @pytest.mark.asyncio
+    async def test_encode_async_defaults_to_encode(self):
+        """Test that the default encode_async delegates to encode."""
+
+        # Arrange
+        class ConcreteClient(EmbeddingsClient):
+            def encode(self, texts: list[str]) -> np.ndarray:
+                return np.full((len(texts), 3), 0.5, dtype=np.float32)
+
+            def get_embedding_dimension(self) -> int:
+                return 3
+
+        # Act
+        result = await ConcreteClient().encode_async(["first", "second"])
+
+        # Assert
+        assert result.shape == (2, 3)
+
 
 # =============================================================================
 # TESTS: SentenceTransformersClient
@@ -722,6 +740,46 @@ class TestLiteLLMClient:
             with pytest.raises(RuntimeError, match="Failed to generate embeddings via LiteLLM"):
                 client.encode(["test"])
 
+    @pytest.mark.asyncio
+    async def test_encode_async_uses_async_api(self, mock_litellm_response):
+        """Test that encode_async awaits LiteLLM's async embedding call."""
+        # Arrange
+        with (
+            patch("litellm.aembedding", new_callable=AsyncMock) as mock_aembedding,
+            patch("litellm.embedding") as mock_embedding,
+        ):
+            mock_aembedding.return_value = mock_litellm_response
+            client = LiteLLMClient(
+                model_name="openai/text-embedding-3-small",
+                api_base="https://custom.api.com",
+            )
+
+            # Act
+            result = await client.encode_async(["test"])
+
+            # Assert
+            assert result.shape == (2, 4)
+            assert result.dtype == np.float32
+            assert client._validated_dimension == 4
+            mock_aembedding.assert_awaited_once_with(
+                model="openai/text-embedding-3-small",
+                input=["test"],
+                api_base="https://custom.api.com",
+            )
+            mock_embedding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_encode_async_handles_api_error(self):
+        """Test handling of API errors during async encoding."""
+        # Arrange
+        with patch("litellm.aembedding", new_callable=AsyncMock) as mock_aembedding:
+            mock_aembedding.side_effect = Exception("API error")
+            client = LiteLLMClient(model_name="openai/text-embedding-3-small")
+
+            # Act & Assert
+            with pytest.raises(RuntimeError, match="Failed to generate embeddings via LiteLLM"):
+                await client.encode_async(["test"])
+
     def test_get_embedding_dimension_from_validated(self, mock_litellm_response):
         """Test getting dimension from validated dimension (after encode)."""
         # Arrange
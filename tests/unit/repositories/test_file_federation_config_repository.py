@@ -0,0 +1,111 @@
+"""
+Unit tests for FileFederationConfigRepository.
+
+Tests the file-based federation config storage, including the
+mtime-keyed parse cache used by get_config.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from registry.repositories.file.federation_config_repository import (
+    FileFederationConfigRepository,
+    _load_config_file,
+)
+from registry.schemas.federation_schema import FederationConfig
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def federation_repository(tmp_path: Path) -> FileFederationConfigRepository:
+    """Create a repository backed by a temporary directory."""
+    _load_config_file.cache_clear()
+    return FileFederationConfigRepository(config_dir=tmp_path)
+
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+@pytest.mark.repositories
+class TestFileFederationConfigRepository:
+    """Tests for FileFederationConfigRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_missing_config_returns_none(self, federation_repository):
+        """A config that was never saved should return None."""
+        assert await federation_repository.get_config("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_save_and_get_round_trip(self, federation_repository):
+        """A saved config should be returned with the same values."""
+        config = FederationConfig(
+            anthropic={"enabled": True, "servers": [{"name": "io.github/fetch"}]}
+        )
+
+        await federation_repository.save_config(config)
+        loaded = await federation_repository.get_config()
+
+        assert loaded is not None
+        assert loaded.model_dump() == config.model_dump()
+        assert loaded.get_enabled_federations() == ["anthropic"]
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_reuse_cached_config(self, federation_repository):
+        """Reading an unchanged file twice should return the cached instance."""
+        await federation_repository.save_config(FederationConfig())
+
+        first = await federation_repository.get_config()
+        second = await federation_repository.get_config()
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_file_change_invalidates_cache(self, federation_repository, tmp_path):
+        """An edit made outside the repository should be visible on the next read."""
+        await federation_repository.save_config(FederationConfig())
+        await federation_repository.get_config()
+
+        config_path = tmp_path / "default.json"
+        config_path.write_text(FederationConfig(asor={"enabled": True}).model_dump_json())
+        # Guarantee a distinct mtime even on coarse-grained filesystems
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        loaded = await federation_repository.get_config()
+
+        assert loaded.get_enabled_federations() == ["asor"]
+
+    @pytest.mark.asyncio
+    async def test_save_within_same_mtime_invalidates_cache(self, federation_repository, tmp_path):
+        """A save that leaves the mtime unchanged should still be visible on the next read."""
+        config_path = tmp_path / "default.json"
+        await federation_repository.save_config(FederationConfig())
+        first_stat = config_path.stat()
+        await federation_repository.get_config()
+
+        await federation_repository.save_config(FederationConfig(asor={"enabled": True}))
+        # Simulate a coarse filesystem where both writes share one timestamp tick
+        os.utime(config_path, ns=(first_stat.st_atime_ns, first_stat.st_mtime_ns))
+
+        loaded = await federation_repository.get_config()
+
+        assert loaded.get_enabled_federations() == ["asor"]
+
+    @pytest.mark.asyncio
+    async def test_delete_clears_cached_config(self, federation_repository):
+        """Deleting a config should drop it from the parse cache."""
+        await federation_repository.save_config(FederationConfig())
+        await federation_repository.get_config()
+
+        assert await federation_repository.delete_config() is True
+
+        assert _load_config_file.cache_info().currsize == 0
+        assert await federation_repository.get_config() is None
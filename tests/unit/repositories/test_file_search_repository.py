@@ -0,0 +1,47 @@
+"""
+Unit tests for FaissSearchRepository.
+
+Tests the file-based search repository wrapper around the shared FAISS service.
+"""
+
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from registry.repositories.file.search_repository import FaissSearchRepository
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+@pytest.fixture
+def mock_faiss_service():
+    """Patch the shared FAISS service used by the repository."""
+    service = MagicMock()
+    service.flush = AsyncMock()
+    with patch("registry.search.service.faiss_service", service):
+        yield service
+
+
+# =============================================================================
+# FLUSH TESTS
+# =============================================================================
+
+
+@pytest.mark.unit
+class TestFlush:
+    """Tests for persisting deferred index updates."""
+
+    @pytest.mark.asyncio
+    async def test_flush_delegates_to_faiss_service(self, mock_faiss_service):
+        """Flushing the repository should flush the FAISS service."""
+        repo = FaissSearchRepository()
+
+        await repo.flush()
+
+        mock_faiss_service.flush.assert_awaited_once()
@@ -0,0 +1,193 @@
+"""
+Unit tests for federation configuration schema models.
+
+Tests cover:
+- Default values for the root and per-source configs
+- Trusted-document construction via FederationConfig.from_trusted_dict
+- Enabled-federation helpers
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from registry.schemas.federation_schema import (
+    AnthropicServerConfig,
+    AsorAgentConfig,
+    FederationConfig,
+)
+
+
+def _stored_config_document() -> dict:
+    """Build a config document shaped like FederationConfig.model_dump() output."""
+    return FederationConfig(
+        anthropic={
+            "enabled": True,
+            "sync_on_startup": True,
+            "servers": [{"name": "ai.smithery/github"}, {"name": "io.github/fetch"}],
+        },
+        asor={
+            "enabled": False,
+            "endpoint": "https://asor.example.com/api",
+            "agents": [{"id": "agent-1"}],
+        },
+    ).model_dump()
+
+
+@pytest.mark.unit
+class TestFederationConfigDefaults:
+    """Tests for FederationConfig default values."""
+
+    def test_defaults_disable_all_federations(self):
+        """A bare config should have every federation disabled."""
+        config = FederationConfig()
+
+        assert config.anthropic.enabled is False
+        assert config.asor.enabled is False
+        assert config.is_any_federation_enabled() is False
+        assert config.get_enabled_federations() == []
+
+    def test_default_anthropic_endpoint(self):
+        """The Anthropic endpoint should default to the public registry."""
+        config = FederationConfig()
+
+        assert config.anthropic.endpoint == "https://registry.modelcontextprotocol.io"
+        assert len(config.anthropic.servers) == 0
+        assert len(config.asor.agents) == 0
+
+    def test_default_sections_are_shared(self):
+        """Bare configs should share the frozen default section instances."""
+        first = FederationConfig()
+        second = FederationConfig()
+
+        assert first.anthropic is second.anthropic
+        assert first.asor is second.asor
+
+    def test_server_and_agent_lists_stored_as_tuples(self):
+        """List input should be accepted and stored as an immutable tuple."""
+        config = FederationConfig(
+            anthropic={"servers": [{"name": "ai.smithery/github"}]},
+            asor={"agents": [{"id": "agent-1"}]},
+        )
+
+        assert isinstance(config.anthropic.servers, tuple)
+        assert isinstance(config.asor.agents, tuple)
+        assert config.anthropic.servers[0].name == "ai.smithery/github"
+        assert config.asor.agents[0].id == "agent-1"
+
+
+@pytest.mark.unit
+class TestFromTrustedDict:
+    """Tests for FederationConfig.from_trusted_dict."""
+
+    def test_matches_validated_config(self):
+        """Trusted construction should produce the same config as validation."""
+        document = _stored_config_document()
+
+        trusted = FederationConfig.from_trusted_dict(document)
+        validated = FederationConfig.model_validate(document)
+
+        assert trusted.model_dump() == validated.model_dump()
+
+    def test_builds_nested_models(self):
+        """Nested server and agent entries should be model instances, not dicts."""
+        config = FederationConfig.from_trusted_dict(_stored_config_document())
+
+        assert all(isinstance(s, AnthropicServerConfig) for s in config.anthropic.servers)
+        assert all(isinstance(a, AsorAgentConfig) for a in config.asor.agents)
+        assert [s.name for s in config.anthropic.servers] == [
+            "ai.smithery/github",
+            "io.github/fetch",
+        ]
+
+    def test_missing_sections_use_defaults(self):
+        """Missing sections should fall back to field defaults."""
+        config = FederationConfig.from_trusted_dict({})
+
+        assert config.anthropic.enabled is False
+        assert config.anthropic.endpoint == "https://registry.modelcontextprotocol.io"
+        assert config.asor.endpoint == ""
+        assert config.get_enabled_federations() == []
+
+    def test_enabled_helpers(self):
+        """Enabled-federation helpers should reflect the stored flags."""
+        config = FederationConfig.from_trusted_dict(_stored_config_document())
+
+        assert config.is_any_federation_enabled() is True
+        assert config.get_enabled_federations() == ["anthropic"]
+
+
+@pytest.mark.unit
+class TestEnabledFederations:
+    """Tests for the precomputed enabled-federation helpers."""
+
+    def test_both_enabled_in_declaration_order(self):
+        """Enabled names should be listed anthropic first, then asor."""
+        config = FederationConfig(anthropic={"enabled": True}, asor={"enabled": True})
+
+        assert config.is_any_federation_enabled() is True
+        assert config.get_enabled_federations() == ["anthropic", "asor"]
+
+    def test_returned_list_is_a_copy(self):
+        """Mutating the returned list should not affect the config."""
+        config = FederationConfig(asor={"enabled": True})
+
+        config.get_enabled_federations().append("anthropic")
+
+        assert config.get_enabled_federations() == ["asor"]
+
+
+@pytest.mark.unit
+class TestFederationConfigImmutability:
+    """Tests for frozen federation models."""
+
+    def test_cannot_reassign_fields(self):
+        """Assigning to a field on a frozen config should raise."""
+        config = FederationConfig()
+
+        with pytest.raises(ValidationError):
+            config.anthropic = config.anthropic
+        with pytest.raises(ValidationError):
+            config.asor.enabled = True
+
+    def test_model_copy_builds_updated_config(self):
+        """model_copy should produce an updated config and leave the original untouched."""
+        config = FederationConfig()
+
+        anthropic = config.anthropic.model_copy(
+            update={"servers": (AnthropicServerConfig(name="io.github/fetch"),)}
+        )
+        updated = config.model_copy(update={"anthropic": anthropic})
+
+        assert [s.name for s in updated.anthropic.servers] == ["io.github/fetch"]
+        assert config.anthropic.servers == ()
+
+    def test_models_do_not_allocate_weakref_slot(self):
+        """Empty __slots__ should keep instances free of a __weakref__ slot."""
+        config = FederationConfig(
+            anthropic={"servers": [{"name": "io.github/fetch"}]},
+            asor={"agents": [{"id": "agent-1"}]},
+        )
+
+        for model in (
+            config,
+            config.anthropic,
+            config.asor,
+            config.anthropic.servers[0],
+            config.asor.agents[0],
+        ):
+            assert not hasattr(model, "__weakref__")
+
+    def test_helpers_follow_model_copy_updates(self):
+        """A copy that changes a section's enabled flag should report the new flags."""
+        config = FederationConfig(anthropic={"enabled": True})
+
+        asor = config.asor.model_copy(update={"enabled": True})
+        updated = config.model_copy(update={"asor": asor})
+
+        assert updated.get_enabled_federations() == ["anthropic", "asor"]
+
+        anthropic = config.anthropic.model_copy(update={"enabled": False})
+        disabled = config.model_copy(update={"anthropic": anthropic})
+
+        assert disabled.is_any_federation_enabled() is False
+        assert disabled.get_enabled_federations() == []
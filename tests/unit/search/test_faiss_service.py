@@ -9,16 +9,18 @@ This module tests all core functionality of the FaissService including:
 - Embeddings generation and normalization
 """
 
+import asyncio
 import json
 import logging
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import numpy as np
 import pytest
 
 from registry.schemas.agent_models import AgentCard
-from registry.search.service import FaissService, _PydanticAwareJSONEncoder
-from tests.fixtures.factories import AgentCardFactory
+from registry.search.service import FaissService, _EncodeBatcher, _tokenize_query
+from tests.fixtures.factories import AgentCardFactory, SkillFactory
 from tests.fixtures.mocks.mock_embeddings import MockEmbeddingsClient
 
 logger = logging.getLogger(__name__)
@@ -123,6 +125,33 @@ class TestFaissServiceInitialization:
         assert service.metadata_store == {}
         assert service.next_id_counter == 0
 
+    def test_initialize_new_index_fp16_quantization(self, mock_settings, monkeypatch):
+        """Test fp16 quantization builds a scalar-quantized inner product index."""
+        from registry.search import service as service_module
+
+        monkeypatch.setattr(service_module.settings, "faiss_index_quantization", "fp16")
+        created = []
+        original = service_module.faiss.IndexScalarQuantizer
+
+        def spy(d, qtype, metric):
+            created.append((d, qtype, metric))
+            return original(d, qtype, metric)
+
+        monkeypatch.setattr(service_module.faiss, "IndexScalarQuantizer", spy)
+
+        service = FaissService()
+        service._initialize_new_index()
+
+        faiss_module = service_module.faiss
+        assert created == [
+            (
+                service_module.settings.embeddings_model_dimensions,
+                faiss_module.ScalarQuantizer.QT_fp16,
+                faiss_module.METRIC_INNER_PRODUCT,
+            )
+        ]
+        assert service.faiss_index.ntotal == 0
+
     @pytest.mark.asyncio
     async def test_initialize_loads_model_and_index(self, mock_settings, monkeypatch):
         """Test that initialize() loads embedding model and FAISS data."""
@@ -152,6 +181,27 @@ class TestFaissServiceInitialization:
         assert service.embedding_model is not None
         assert service.faiss_index is not None
 
+    @pytest.mark.asyncio
+    async def test_initialize_sets_faiss_threads(self, mock_settings, monkeypatch):
+        """Test initialize() applies the configured FAISS OpenMP thread count."""
+        from registry.search import service as service_module
+
+        thread_counts = []
+        monkeypatch.setattr(service_module.settings, "faiss_num_threads", 2)
+        monkeypatch.setattr(service_module.faiss, "omp_set_num_threads", thread_counts.append)
+
+        service = FaissService()
+
+        async def noop():
+            return None
+
+        monkeypatch.setattr(service, "_load_embedding_model", noop)
+        monkeypatch.setattr(service, "_load_faiss_data", noop)
+
+        await service.initialize()
+
+        assert thread_counts == [2]
+
     @pytest.mark.asyncio
     async def test_load_faiss_data_creates_new_when_missing(self, mock_settings):
         """Test that _load_faiss_data creates new index when files don't exist."""
@@ -197,6 +247,44 @@ class TestFaissServiceInitialization:
 
         assert service.metadata_store == metadata["metadata"]
         assert service.next_id_counter == 1
+        assert service._id_to_path == {0: "test-server"}
+
+    @pytest.mark.asyncio
+    async def test_load_faiss_data_tombstones_orphaned_ids(self, mock_settings):
+        """Test that vectors no metadata entry owns are purged on the next save."""
+        import faiss
+
+        service = FaissService()
+        metadata = {
+            "metadata": {
+                "test-server": {
+                    "id": 1,
+                    "text_for_embedding": "test text",
+                    "full_server_info": {"server_name": "test-server"},
+                    "entity_type": "mcp_server",
+                }
+            },
+            "next_id": 2,
+        }
+        mock_settings.faiss_metadata_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(mock_settings.faiss_metadata_path, "w") as f:
+            json.dump(metadata, f)
+        mock_settings.faiss_index_path.touch()
+
+        stored_index = faiss.IndexIDMap(faiss.IndexFlatIP(384))
+        stored_index.add_with_ids(
+            np.ones((2, 384), dtype=np.float32), np.array([0, 1], dtype=np.int64)
+        )
+
+        with patch.object(faiss, "read_index", return_value=stored_index):
+            await service._load_faiss_data()
+
+        assert service._tombstoned_ids == {0}
+
+        await service.save_data()
+
+        assert service.faiss_index.ntotal == 1
+        assert service._tombstoned_ids == set()
 
 
 # =============================================================================
@@ -220,6 +308,23 @@ class TestTextPreparation:
         assert "set_data" in text
         assert "Retrieve data from source" in text
 
+    def test_get_text_for_embedding_exact_format(self, faiss_service, sample_server_info):
+        """Test the embedding text format stays stable so stored entries are not re-embedded."""
+        sample_server_info["metadata"] = {"team": "search"}
+
+        text = faiss_service._get_text_for_embedding(sample_server_info)
+
+        assert text == (
+            "Name: test-server\n"
+            "Description: A test server for search testing\n"
+            "Tags: test, search, demo\n"
+            "Tools:\n"
+            "Tool: get_data. Description: Retrieve data from source. Args: id: string\n"
+            "Tool: set_data. Description: Update data in source. Args: id: string, value: any\n"
+            "Metadata:\n"
+            "team: search"
+        )
+
     def test_get_text_for_embedding_handles_missing_fields(self, faiss_service):
         """Test _get_text_for_embedding handles missing fields gracefully."""
         server_info = {"server_name": "minimal-server"}
@@ -249,6 +354,31 @@ class TestTextPreparation:
         assert "skilled-agent" in text
         assert "Skills:" in text
 
+    def test_get_text_for_agent_exact_format(self, faiss_service):
+        """Test the agent embedding text format stays stable across refactors."""
+        agent = AgentCardFactory(
+            name="skilled-agent",
+            description="Agent with skills",
+            skills=[
+                SkillFactory(name="search", description="Find things"),
+                SkillFactory(name="summarize", description="Shorten text"),
+            ],
+            tags=["alpha", "beta"],
+            metadata={"team": "search"},
+        )
+
+        text = faiss_service._get_text_for_agent(agent)
+
+        assert text == (
+            "Name: skilled-agent\n"
+            "Description: Agent with skills\n"
+            "Skills: search, summarize\n"
+            "Skill Details: search: Find things | summarize: Shorten text\n"
+            "Tags: alpha, beta\n"
+            "Metadata:\n"
+            "team: search"
+        )
+
     def test_get_text_for_embedding_includes_metadata(self, faiss_service):
         """Test _get_text_for_embedding includes metadata in embedding text."""
         server_info = {
@@ -365,6 +495,15 @@ class TestEmbeddingOperations:
         # Should return original vector when norm is 0
         assert np.array_equal(normalized, vector)
 
+    def test_normalize_embedding_batch(self, faiss_service):
+        """Test _normalize_embedding normalizes each row of a batch."""
+        batch = np.array([[3.0, 4.0, 0.0], [0.0, 0.0, 2.0]], dtype=np.float32)
+
+        normalized = faiss_service._normalize_embedding(batch)
+
+        assert normalized.shape == batch.shape
+        assert np.allclose(np.linalg.norm(normalized, axis=1), 1.0, atol=1e-6)
+
     def test_normalize_embedding_already_normalized(self, faiss_service):
         """Test _normalize_embedding handles already normalized vector."""
         # Create already normalized vector
@@ -376,6 +515,99 @@ class TestEmbeddingOperations:
         assert np.allclose(normalized, vector, atol=1e-6)
 
 
+@pytest.mark.unit
+@pytest.mark.search
+class TestEncodeBatcher:
+    """Tests for coalescing concurrent encode requests."""
+
+    @pytest.mark.asyncio
+    async def test_lone_request_does_not_wait(self):
+        """Test an idle batcher encodes a single text without waiting for company."""
+        calls: list[list[str]] = []
+
+        async def encode(texts: list[str]) -> list[str]:
+            calls.append(texts)
+            return [f"vec:{text}" for text in texts]
+
+        batcher = _EncodeBatcher(encode)
+
+        task = asyncio.ensure_future(batcher.encode("solo"))
+        # A few event loop turns, with no timer to wait out
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert task.done()
+        assert task.result() == "vec:solo"
+        assert calls == [["solo"]]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Test texts arriving during an encode share the next length-sorted batch."""
+        calls: list[list[str]] = []
+
+        async def encode(texts: list[str]) -> list[str]:
+            calls.append(texts)
+            return [f"vec:{text}" for text in texts]
+
+        batcher = _EncodeBatcher(encode)
+
+        results = await asyncio.gather(
+            batcher.encode("a longer text"),
+            batcher.encode("short"),
+            batcher.encode("mid text"),
+        )
+
+        assert calls == [["a longer text"], ["short", "mid text"]]
+        assert results == ["vec:a longer text", "vec:short", "vec:mid text"]
+
+    @pytest.mark.asyncio
+    async def test_encode_error_reaches_every_caller(self):
+        """Test a failing encode call raises for each waiting caller."""
+
+        async def encode(texts: list[str]) -> list[str]:
+            raise RuntimeError("model unavailable")
+
+        batcher = _EncodeBatcher(encode)
+
+        results = await asyncio.gather(
+            batcher.encode("one"),
+            batcher.encode("two"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_same_path_upserts_in_one_batch_keep_one_vector(
+        self, faiss_service, sample_server_info, monkeypatch
+    ):
+        """Test two upserts of one path encoded in the same batch map one vector to it."""
+        encoded: list[list[str]] = []
+        original_encode = faiss_service._encode_texts
+
+        async def spy_encode(texts: list[str]):
+            encoded.append(texts)
+            return await original_encode(texts)
+
+        monkeypatch.setattr(faiss_service._encode_batcher, "_encode", spy_encode)
+        service_path = "/servers/test-server"
+
+        # The first upsert is encoded alone; the other two share the next batch
+        await asyncio.gather(
+            faiss_service.add_or_update_service(service_path, sample_server_info),
+            *(
+                faiss_service.add_or_update_service(
+                    service_path, {**sample_server_info, "description": f"Batched update {i}"}
+                )
+                for i in range(2)
+            ),
+        )
+
+        assert [len(texts) for texts in encoded] == [1, 2]
+        metadata = faiss_service.metadata_store[service_path]
+        assert faiss_service._id_to_path == {metadata["id"]: service_path}
+
+
 # =============================================================================
 # ADD/UPDATE ENTITY TESTS
 # =============================================================================
@@ -445,13 +677,70 @@ class TestAddUpdateService:
         sample_server_info["description"] = "Completely different description"
         await faiss_service.add_or_update_service(service_path, sample_server_info, is_enabled=True)
 
-        # Should use same ID
+        # Should move to a fresh ID and retire the old vector
         metadata = faiss_service.metadata_store[service_path]
-        assert metadata["id"] == initial_id
+        assert metadata["id"] != initial_id
+        assert faiss_service._id_to_path == {metadata["id"]: service_path}
+        assert initial_id in faiss_service._tombstoned_ids
 
         # Should have re-embedded
         assert "Completely different description" in metadata["text_for_embedding"]
 
+    @pytest.mark.asyncio
+    async def test_concurrent_adds_of_new_path_leave_one_vector(
+        self, faiss_service, sample_server_info
+    ):
+        """Test concurrent first-time adds of one path map a single vector to it."""
+        service_path = "/servers/test-server"
+        other_server_info = {**sample_server_info, "description": "Another description"}
+
+        await asyncio.gather(
+            faiss_service.add_or_update_service(service_path, sample_server_info),
+            faiss_service.add_or_update_service(service_path, other_server_info),
+        )
+
+        metadata = faiss_service.metadata_store[service_path]
+        assert faiss_service._id_to_path == {metadata["id"]: service_path}
+
+        results = await faiss_service.search_mixed("test server")
+        assert [server["path"] for server in results["servers"]] == [service_path]
+
+    @pytest.mark.asyncio
+    async def test_identical_text_reuses_cached_embedding(
+        self, faiss_service, sample_server_info, monkeypatch
+    ):
+        """Test a second entity with the same embedding text skips the model."""
+        encoded: list[list[str]] = []
+        original_encode = faiss_service._encode_texts
+
+        async def spy_encode(texts: list[str]):
+            encoded.append(texts)
+            return await original_encode(texts)
+
+        monkeypatch.setattr(faiss_service._encode_batcher, "_encode", spy_encode)
+
+        await faiss_service.add_or_update_service("/servers/first", sample_server_info)
+        await faiss_service.add_or_update_service("/servers/second", sample_server_info)
+
+        assert len(encoded) == 1
+        assert faiss_service.faiss_index.ntotal == 2
+
+    @pytest.mark.asyncio
+    async def test_embedding_cache_evicts_least_recent(
+        self, faiss_service, mock_settings, monkeypatch
+    ):
+        """Test the embedding cache stays within its configured size."""
+        from registry.search import service as service_module
+
+        monkeypatch.setattr(service_module.settings, "embeddings_cache_size", 2)
+
+        for name in ("alpha", "beta", "gamma"):
+            await faiss_service.add_or_update_service(
+                f"/servers/{name}", {"server_name": name, "description": name}
+            )
+
+        assert len(faiss_service._embedding_cache) == 2
+
     @pytest.mark.asyncio
     async def test_add_service_without_model(self, mock_settings):
         """Test adding service fails gracefully without embedding model."""
@@ -509,6 +798,23 @@ class TestAddUpdateAgent:
         assert faiss_service.faiss_index.ntotal == initial_total
         assert faiss_service.next_id_counter == initial_counter
 
+    @pytest.mark.asyncio
+    async def test_update_unchanged_agent_skips_dump_and_save(
+        self, faiss_service, sample_agent_card
+    ):
+        """Test an unchanged agent card is detected by fingerprint alone."""
+        agent_path = "/agents/test-agent"
+        await faiss_service.add_or_update_agent(agent_path, sample_agent_card)
+        assert faiss_service.metadata_store[agent_path]["agent_hash"]
+
+        with (
+            patch.object(AgentCard, "model_dump", side_effect=AssertionError("dumped")),
+            patch.object(faiss_service, "_schedule_save") as schedule_save,
+        ):
+            await faiss_service.add_or_update_agent(agent_path, sample_agent_card)
+
+        schedule_save.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_update_existing_agent_different_text(self, faiss_service):
         """Test updating agent with different text re-embeds."""
@@ -524,9 +830,10 @@ class TestAddUpdateAgent:
         agent2 = AgentCardFactory(name="test-agent", description="New description")
         await faiss_service.add_or_update_agent(agent_path, agent2, is_enabled=True)
 
-        # Should use same ID
+        # Should move to a fresh ID and retire the old vector
         metadata = faiss_service.metadata_store[agent_path]
-        assert metadata["id"] == initial_id
+        assert metadata["id"] != initial_id
+        assert initial_id in faiss_service._tombstoned_ids
 
         # Should have re-embedded
         assert "New description" in metadata["text_for_embedding"]
@@ -573,6 +880,19 @@ class TestRemoveEntities:
         # Should be removed from metadata
         assert service_path not in faiss_service.metadata_store
 
+    @pytest.mark.asyncio
+    async def test_removed_service_not_returned_by_search(self, faiss_service, sample_server_info):
+        """Test a removed service no longer maps back from FAISS search hits."""
+        service_path = "/servers/test-server"
+        await faiss_service.add_or_update_service(service_path, sample_server_info, is_enabled=True)
+        faiss_id = faiss_service.metadata_store[service_path]["id"]
+
+        await faiss_service.remove_service(service_path)
+        results = await faiss_service.search_mixed("test server")
+
+        assert faiss_id not in faiss_service._id_to_path
+        assert results["servers"] == []
+
     @pytest.mark.asyncio
     async def test_remove_nonexistent_service(self, faiss_service):
         """Test removing non-existent service logs warning."""
@@ -615,6 +935,36 @@ class TestRemoveEntities:
         # Should be removed
         assert agent_path not in faiss_service.metadata_store
 
+    @pytest.mark.asyncio
+    async def test_remove_entity_routes_server(self, faiss_service, sample_server_info):
+        """Test remove_entity removes a server through the service path."""
+        service_path = "/servers/test-server"
+        await faiss_service.add_or_update_service(service_path, sample_server_info)
+        faiss_id = faiss_service.metadata_store[service_path]["id"]
+
+        await faiss_service.remove_entity(service_path)
+
+        assert service_path not in faiss_service.metadata_store
+        assert faiss_id in faiss_service._tombstoned_ids
+
+    @pytest.mark.asyncio
+    async def test_remove_entity_unknown_path(self, faiss_service):
+        """Test remove_entity on an unknown path does not raise."""
+        await faiss_service.remove_entity("/servers/nonexistent")
+
+    @pytest.mark.asyncio
+    async def test_add_entity_routes_by_type(self, faiss_service, sample_server_info):
+        """Test add_or_update_entity indexes known types and ignores others."""
+        await faiss_service.add_or_update_entity(
+            "/servers/test-server", sample_server_info, "mcp_server", is_enabled=True
+        )
+        await faiss_service.add_or_update_entity(
+            "/skills/test-skill", {"name": "test-skill"}, "skill"
+        )
+
+        assert faiss_service.metadata_store["/servers/test-server"]["entity_type"] == "mcp_server"
+        assert "/skills/test-skill" not in faiss_service.metadata_store
+
 
 # =============================================================================
 # SEARCH TESTS
@@ -705,6 +1055,33 @@ class TestSearch:
         assert len(results["servers"]) >= 0  # May or may not find server depending on mock
         assert len(results["agents"]) == 0  # Should not return agents
 
+    @pytest.mark.asyncio
+    async def test_search_mixed_agent_filter_skips_server_scoring(
+        self, faiss_service, sample_server_info, sample_agent_card, monkeypatch
+    ):
+        """Test agent-only searches do not score or scan server hits."""
+        await faiss_service.add_or_update_service(
+            "/servers/test-server", sample_server_info, is_enabled=True
+        )
+        await faiss_service.add_or_update_agent(
+            "/agents/test-agent", sample_agent_card, is_enabled=True
+        )
+
+        boosted: list[str] = []
+        original_boost = faiss_service._calculate_keyword_boost
+
+        def spy_boost(query: str, info: dict[str, Any]) -> float:
+            boosted.append(info.get("server_name"))
+            return original_boost(query, info)
+
+        monkeypatch.setattr(faiss_service, "_calculate_keyword_boost", spy_boost)
+
+        results = await faiss_service.search_mixed("test", entity_types=["a2a_agent"])
+
+        assert results["servers"] == []
+        assert results["tools"] == []
+        assert boosted == [sample_agent_card.name]
+
     @pytest.mark.asyncio
     async def test_search_mixed_extracts_tools(self, faiss_service, sample_server_info):
         """Test search_mixed extracts matching tools."""
@@ -738,6 +1115,8 @@ class TestSearch:
         results = await faiss_service.search_mixed("test server", max_results=5)
 
         assert len(results["servers"]) <= 5
+        scores = [server["relevance_score"] for server in results["servers"]]
+        assert scores == sorted(scores, reverse=True)
 
     @pytest.mark.asyncio
     async def test_search_entities_wrapper(self, faiss_service, sample_server_info):
@@ -810,6 +1189,12 @@ class TestKeywordBoost:
         # Stopwords should not contribute to boost
         assert boost == 1.0
 
+    def test_tokenize_query_drops_stopwords_and_short_tokens(self):
+        """Test query tokenization lowercases and filters noise words."""
+        tokens = _tokenize_query("How do I Get weather-data for NYC?")
+
+        assert tokens == ["weather", "data", "nyc"]
+
     def test_calculate_keyword_boost_capped_at_max(self, faiss_service):
         """Test keyword boost is capped at maximum value."""
         # Create server with many matching keywords
@@ -925,46 +1310,56 @@ class TestToolExtraction:
 
 
 # =============================================================================
-# DISTANCE/RELEVANCE CONVERSION TESTS
+# SIMILARITY/RELEVANCE CONVERSION TESTS
 # =============================================================================
 
 
 @pytest.mark.unit
 @pytest.mark.search
-class TestDistanceConversion:
-    """Tests for distance to relevance score conversion."""
+class TestSimilarityConversion:
+    """Tests for inner product similarity to relevance score conversion."""
 
-    def test_distance_to_relevance_positive_distance(self, faiss_service):
-        """Test _distance_to_relevance handles positive distances."""
-        # Positive distance (1 - inner_product)
-        relevance = faiss_service._distance_to_relevance(0.05)
+    def test_similarity_to_relevance_passes_through_cosine(self, faiss_service):
+        """Test _similarity_to_relevance returns the inner product for unit vectors."""
+        relevance = faiss_service._similarity_to_relevance(0.95)
 
-        # Should convert: 1 - 0.05 = 0.95
         assert 0.94 <= relevance <= 0.96
 
-    def test_distance_to_relevance_negative_distance(self, faiss_service):
-        """Test _distance_to_relevance handles negative distances."""
-        # Negative distance (-inner_product)
-        relevance = faiss_service._distance_to_relevance(-0.95)
+    def test_similarity_to_relevance_higher_is_more_relevant(self, faiss_service):
+        """Test a higher inner product maps to a higher relevance."""
+        assert faiss_service._similarity_to_relevance(0.9) > faiss_service._similarity_to_relevance(
+            0.2
+        )
 
-        # Should convert: -(-0.95) = 0.95
-        assert 0.94 <= relevance <= 0.96
+    def test_similarity_to_relevance_negative_is_zero(self, faiss_service):
+        """Test _similarity_to_relevance maps dissimilar vectors to zero."""
+        relevance = faiss_service._similarity_to_relevance(-0.5)
+
+        assert relevance == 0.0
+
+    def test_similarity_to_relevance_clamped(self, faiss_service):
+        """Test _similarity_to_relevance clamps to [0, 1] range."""
+        assert faiss_service._similarity_to_relevance(1.0001) == 1.0
+        assert faiss_service._similarity_to_relevance(-2.0) == 0.0
+
+    def test_similarity_to_relevance_array(self, faiss_service):
+        """Test an array of scores is clamped element-wise."""
+        similarities = np.array([1.0001, 0.5, -0.3], dtype=np.float32)
 
-    def test_distance_to_relevance_zero(self, faiss_service):
-        """Test _distance_to_relevance handles zero distance."""
-        relevance = faiss_service._distance_to_relevance(0.0)
+        relevance = faiss_service._similarity_to_relevance(similarities)
 
-        assert relevance == 1.0
+        np.testing.assert_allclose(relevance, [1.0, 0.5, 0.0])
 
-    def test_distance_to_relevance_clamped(self, faiss_service):
-        """Test _distance_to_relevance clamps to [0, 1] range."""
-        # Test upper bound
-        relevance_high = faiss_service._distance_to_relevance(-2.0)
-        assert relevance_high <= 1.0
+    @pytest.mark.asyncio
+    async def test_search_mixed_exact_match_scores_highest(self, faiss_service):
+        """Test a query identical to an entity's text scores as a near-perfect match."""
+        server_info = {"server_name": "weather", "description": "Forecasts", "tags": []}
+        await faiss_service.add_or_update_service("/weather", server_info, is_enabled=True)
+        query = faiss_service.metadata_store["/weather"]["text_for_embedding"]
+
+        results = await faiss_service.search_mixed(query, entity_types=["mcp_server"])
 
-        # Test lower bound
-        relevance_low = faiss_service._distance_to_relevance(2.0)
-        assert relevance_low >= 0.0
+        assert results["servers"][0]["relevance_score"] > 0.99
 
 
 # =============================================================================
@@ -1010,48 +1405,135 @@ class TestPersistence:
         # Should not create files
         assert not mock_settings.faiss_metadata_path.exists()
 
-    def test_get_indexed_count(self, faiss_service):
-        """Test getting the count of indexed items."""
-        # Initially empty
-        assert faiss_service.faiss_index.ntotal == 0
+    @pytest.mark.asyncio
+    async def test_save_data_serializes_pydantic_types(self, faiss_service, mock_settings):
+        """Test save_data writes HttpUrl and datetime values as strings."""
+        from datetime import datetime
 
-        # The count is directly from FAISS index
-        count = faiss_service.faiss_index.ntotal
-        assert count == 0
+        from pydantic import HttpUrl
 
+        faiss_service.metadata_store["/servers/typed"] = {
+            "id": 0,
+            "full_server_info": {
+                "proxy_pass_url": HttpUrl("https://example.com"),
+                "registered_at": datetime(2024, 1, 1, 12, 0, 0),
+            },
+        }
 
-# =============================================================================
-# PYDANTIC JSON ENCODER TESTS
-# =============================================================================
+        await faiss_service.save_data()
 
+        with open(mock_settings.faiss_metadata_path) as f:
+            saved_info = json.load(f)["metadata"]["/servers/typed"]["full_server_info"]
 
-@pytest.mark.unit
-@pytest.mark.search
-class TestPydanticJSONEncoder:
-    """Tests for custom Pydantic JSON encoder."""
+        assert saved_info["proxy_pass_url"] == "https://example.com/"
+        assert saved_info["registered_at"].startswith("2024-01-01T12:00:00")
 
-    def test_encoder_handles_httpurl(self):
-        """Test encoder handles Pydantic HttpUrl type."""
-        from pydantic import HttpUrl
+    @pytest.mark.asyncio
+    async def test_save_data_leaves_no_temp_files(self, faiss_service, mock_settings):
+        """Test save_data swaps the index and metadata files into place atomically."""
+        await faiss_service.save_data()
+
+        servers_dir = mock_settings.faiss_metadata_path.parent
+        assert mock_settings.faiss_index_path.exists()
+        assert mock_settings.faiss_metadata_path.exists()
+        assert list(servers_dir.glob("*.tmp")) == []
 
-        encoder = _PydanticAwareJSONEncoder()
-        url = HttpUrl("https://example.com")
+    @pytest.mark.asyncio
+    async def test_save_data_writes_index_file_outside_lock(
+        self, faiss_service, mock_settings, monkeypatch
+    ):
+        """Test only serialization holds the index lock, not the file write."""
+        from registry.search import service as service_module
 
-        result = encoder.default(url)
+        lock_held_during_write = []
 
-        assert result == "https://example.com/"
+        def spy_open(file, mode="r", *args, **kwargs):
+            if "w" in mode:
+                lock_held_during_write.append(faiss_service._index_lock.locked())
+            return open(file, mode, *args, **kwargs)
 
-    def test_encoder_handles_datetime(self):
-        """Test encoder handles datetime objects."""
-        from datetime import datetime
+        monkeypatch.setattr(
+            service_module.faiss, "serialize_index", lambda index: b"serialized-index"
+        )
+        monkeypatch.setattr(service_module, "open", spy_open, raising=False)
 
-        encoder = _PydanticAwareJSONEncoder()
-        dt = datetime(2024, 1, 1, 12, 0, 0)
+        await faiss_service.save_data()
 
-        result = encoder.default(dt)
+        assert mock_settings.faiss_index_path.read_bytes() == b"serialized-index"
+        assert lock_held_during_write == [False, False]
 
-        assert "2024-01-01" in result
-        assert "12:00:00" in result
+    @pytest.mark.asyncio
+    async def test_updates_coalesce_into_one_save(self, faiss_service, sample_server_info):
+        """Test a burst of updates is persisted by a single save."""
+        faiss_service._write_data = AsyncMock()
+
+        for i in range(3):
+            await faiss_service.add_or_update_service(
+                f"/servers/server-{i}", sample_server_info, is_enabled=True
+            )
+        await faiss_service.flush()
+
+        faiss_service._write_data.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_save_data_purges_stale_vectors(self, faiss_service, sample_server_info):
+        """Test superseded and removed vectors leave the index on save."""
+        await faiss_service.add_or_update_service("/servers/a", sample_server_info)
+        await faiss_service.add_or_update_service("/servers/b", sample_server_info)
+
+        sample_server_info["description"] = "Re-embedded description"
+        await faiss_service.add_or_update_service("/servers/a", sample_server_info)
+        await faiss_service.remove_service("/servers/b")
+        assert faiss_service.faiss_index.ntotal == 3
+
+        await faiss_service.save_data()
+
+        assert faiss_service.faiss_index.ntotal == 1
+        assert faiss_service._tombstoned_ids == set()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reembeds_tombstone_every_superseded_vector(
+        self, faiss_service, sample_server_info
+    ):
+        """Test concurrent re-embeds of one path leave a single live vector after save."""
+        service_path = "/servers/test-server"
+        await faiss_service.add_or_update_service(service_path, sample_server_info)
+
+        await asyncio.gather(
+            *(
+                faiss_service.add_or_update_service(
+                    service_path, {**sample_server_info, "description": f"Revision {revision}"}
+                )
+                for revision in range(3)
+            )
+        )
+
+        live_ids = [
+            faiss_id for faiss_id, path in faiss_service._id_to_path.items() if path == service_path
+        ]
+        assert live_ids == [faiss_service.metadata_store[service_path]["id"]]
+
+        await faiss_service.save_data()
+
+        assert faiss_service.faiss_index.ntotal == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_without_changes_skips_save(self, faiss_service):
+        """Test flush does nothing when no update is pending."""
+        faiss_service._write_data = AsyncMock()
+
+        await faiss_service.flush()
+
+        faiss_service._write_data.assert_not_awaited()
+
+    def test_get_indexed_count(self, faiss_service):
+        """Test getting the count of indexed items."""
+        # Initially empty
+        assert faiss_service.faiss_index.ntotal == 0
+
+        # The count is directly from FAISS index
+        count = faiss_service.faiss_index.ntotal
+        assert count == 0
 
 
 # =============================================================================